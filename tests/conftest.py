@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tvtelegrambingx.config import Settings
+
+
+@pytest.fixture(scope="session")
+def shared_loop():
+    """Share one event loop across the suite instead of ``asyncio.run`` per call."""
+
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.run_until_complete(loop.shutdown_asyncgens())
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def settings() -> Settings:
+    """Baseline settings; ``Settings`` is frozen, so one instance is safe to share."""
+
+    return Settings(
+        telegram_bot_token="token",
+        telegram_chat_id="123",
+        tradingview_secret=None,
+        bingx_api_key=None,
+        bingx_api_secret=None,
+        bingx_base_url="https://open-api.bingx.com",
+        bingx_recv_window=5000,
+        bingx_default_quantity=None,
+        dry_run=True,
+        tradingview_webhook_enabled=False,
+        tradingview_webhook_route="/webhook",
+        tradingview_host="0.0.0.0",
+        tradingview_port=443,
+        tradingview_ssl_certfile=None,
+        tradingview_ssl_keyfile=None,
+        tradingview_ssl_ca_certs=None,
+        trading_disable_weekends=False,
+        trading_active_hours=None,
+        trading_active_days=None,
+    )
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tvtelegrambingx.integrations import bingx_account
+
+
+def test_concurrent_callers_share_one_request(monkeypatch, shared_loop):
+    calls: list[int] = []
+
+    async def fake_load_positions():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return [{"symbol": "BTC-USDT"}]
+
+    monkeypatch.setattr(bingx_account, "_load_positions", fake_load_positions)
+
+    async def run():
+        return await asyncio.gather(
+            bingx_account.get_positions(share_inflight=True),
+            bingx_account.get_positions(share_inflight=True),
+        )
+
+    first, second = shared_loop.run_until_complete(run())
+
+    assert len(calls) == 1
+    assert first == second == [{"symbol": "BTC-USDT"}]
+    assert first is not second
+    assert bingx_account._POSITIONS_INFLIGHT is None
+
+
+def test_cancelled_leader_fails_waiters_with_runtime_error(monkeypatch, shared_loop):
+    started = asyncio.Event()
+
+    async def fake_load_positions():
+        started.set()
+        await asyncio.sleep(3600)
+        return []
+
+    monkeypatch.setattr(bingx_account, "_load_positions", fake_load_positions)
+
+    async def run():
+        leader = asyncio.ensure_future(bingx_account.get_positions(share_inflight=True))
+        await started.wait()
+        waiter = asyncio.ensure_future(bingx_account.get_positions(share_inflight=True))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        with pytest.raises(RuntimeError):
+            await waiter
+
+    shared_loop.run_until_complete(run())
+
+    assert bingx_account._POSITIONS_INFLIGHT is None
+
+
+def test_unshared_request_is_not_handed_to_sharing_callers(monkeypatch, shared_loop):
+    calls: list[int] = []
+
+    async def fake_load_positions():
+        calls.append(1)
+        call = len(calls)
+        await asyncio.sleep(0)
+        return [{"call": call}]
+
+    monkeypatch.setattr(bingx_account, "_load_positions", fake_load_positions)
+
+    async def run():
+        unshared = asyncio.ensure_future(bingx_account.get_positions())
+        await asyncio.sleep(0)
+        assert bingx_account._POSITIONS_INFLIGHT is None
+        shared = await bingx_account.get_positions(share_inflight=True)
+        return await unshared, shared
+
+    unshared, shared = shared_loop.run_until_complete(run())
+
+    assert unshared == [{"call": 1}]
+    assert shared == [{"call": 2}]
+    assert bingx_account._POSITIONS_INFLIGHT is None
+
+
+def test_configure_closes_the_previous_client(monkeypatch, shared_loop, settings):
+    monkeypatch.setattr(bingx_account, "SETTINGS", None)
+    monkeypatch.setattr(bingx_account, "_CLIENT", None)
+
+    async def run():
+        bingx_account.configure(settings)
+        client = bingx_account._get_client(settings)
+        bingx_account.configure(settings)
+        await asyncio.gather(*bingx_account._CLOSING)
+        return client
+
+    client = shared_loop.run_until_complete(run())
+
+    assert client.is_closed
+    assert bingx_account._CLIENT is None
+    assert not bingx_account._CLOSING
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tvtelegrambingx.config_store import ConfigStore
+
+
+def test_config_store_roundtrip_leaves_no_temp_files(tmp_path):
+    path = tmp_path / "config.json"
+    store = ConfigStore(path)
+
+    store.set_global(auto_trade=True)
+    store.set_symbol("btcusdt", auto_trade=False)
+
+    assert store.get_auto_trade() is True
+    assert store.get_auto_trade("BTCUSDT") is False
+    assert json.loads(path.read_text(encoding="utf-8"))["symbols"] == {
+        "BTCUSDT": {"auto_trade": False}
+    }
+    assert [entry.name for entry in tmp_path.iterdir()] == ["config.json"]
+
+
+def test_config_store_defaults_are_not_shared(tmp_path):
+    path = tmp_path / "config.json"
+    store = ConfigStore(path)
+    path.unlink()
+
+    store.get()["_global"]["auto_trade"] = True
+    path.write_text("{}", encoding="utf-8")
+
+    assert store.get()["_global"]["auto_trade"] is False
+
+
+def test_config_store_skips_unchanged_writes(tmp_path):
+    path = tmp_path / "config.json"
+    store = ConfigStore(path)
+    store.set_global(auto_trade=True)
+    before = path.stat().st_ino
+
+    store.set_global(auto_trade=True)
+    store.clear_global("margin_usdt")
+
+    assert path.stat().st_ino == before
+
+
+def test_config_store_files_keep_readable_permissions(tmp_path):
+    path = tmp_path / "config.json"
+    ConfigStore(path)
+    umask = os.umask(0)
+    os.umask(umask)
+    assert path.stat().st_mode & 0o777 == 0o644 & ~umask
+
+    path.chmod(0o640)
+    ConfigStore(path).set_global(auto_trade=True)
+    assert path.stat().st_mode & 0o777 == 0o640
+
+
+def test_config_store_getters_accept_pre_read_data(tmp_path):
+    store = ConfigStore(tmp_path / "config.json")
+    store.set_global(auto_trade=True, bot_enabled=False)
+    data = store.get()
+    store.set_global(auto_trade=False, bot_enabled=True)
+
+    assert store.get_auto_trade(data=data) is True
+    assert store.get_bot_enabled(data=data) is False
+    assert store.get_auto_trade() is False
+    assert store.get_bot_enabled() is True
+
+
+def test_config_store_pretty_output_is_indented(tmp_path):
+    path = tmp_path / "config.json"
+    store = ConfigStore(path, pretty=True)
+    store.set_global(auto_trade=True)
+
+    text = path.read_text(encoding="utf-8")
+
+    assert text.startswith('{\n  "_global": {\n    "auto_trade": true,')
+    assert store.get_auto_trade() is True
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tvtelegrambingx.webhook.health import HealthCheckInterceptor
+
+
+def _dispatch(shared_loop, app, scope):
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    shared_loop.run_until_complete(app(scope, receive, send))
+    return sent
+
+
+def test_health_is_answered_without_inner_app(shared_loop):
+    forwarded = []
+
+    async def inner(scope, receive, send):
+        forwarded.append(scope["path"])
+
+    app = HealthCheckInterceptor(inner)
+    sent = _dispatch(shared_loop, app, {"type": "http", "path": "/health", "method": "GET"})
+
+    assert forwarded == []
+    assert sent[0]["status"] == 200
+    assert json.loads(sent[1]["body"]) == {"ok": True}
+
+
+def test_other_requests_are_forwarded(shared_loop):
+    forwarded = []
+
+    async def inner(scope, receive, send):
+        forwarded.append((scope["path"], scope["method"]))
+
+    app = HealthCheckInterceptor(inner)
+    _dispatch(shared_loop, app, {"type": "http", "path": "/tradingview-webhook", "method": "POST"})
+    _dispatch(shared_loop, app, {"type": "http", "path": "/health", "method": "POST"})
+
+    assert forwarded == [("/tradingview-webhook", "POST"), ("/health", "POST")]
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import math
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tvtelegrambingx.utils import json_codec
+
+
+def test_stdlib_fallback_matches_orjson_for_finite_data(monkeypatch):
+    pytest.importorskip("orjson")
+    data = {"symbols": {"BTC-USDT": {"margin": 12.5}}, "_global": {"note": "Größe"}}
+    encoded = json_codec.dumps(data)
+
+    monkeypatch.setattr(json_codec, "orjson", None)
+
+    assert json_codec.dumps(data) == encoded
+    assert json_codec.loads(encoded) == data
+
+
+def test_non_finite_floats_encode_identically_in_both_backends(monkeypatch):
+    pytest.importorskip("orjson")
+    data = {"margin_usdt": float("nan"), "levels": [float("inf"), -float("inf"), 1.5]}
+    fast = json_codec.dumps(data)
+
+    monkeypatch.setattr(json_codec, "orjson", None)
+    slow = json_codec.dumps(data)
+
+    assert fast == slow == b'{"levels":[null,null,1.5],"margin_usdt":null}'
+    assert json_codec.loads(slow) == {"margin_usdt": None, "levels": [None, None, 1.5]}
+
+
+def test_legacy_nan_files_stay_loadable(monkeypatch):
+    assert math.isnan(json_codec.loads(b'{"margin_usdt":NaN}')["margin_usdt"])
+
+    monkeypatch.setattr(json_codec, "orjson", None)
+
+    assert math.isnan(json_codec.loads(b'{"margin_usdt":NaN}')["margin_usdt"])
+
+
+def test_pretty_output_matches_between_backends(monkeypatch):
+    pytest.importorskip("orjson")
+    data = {"symbols": {}, "_global": {"auto_trade": True, "levels": [1, 2.5]}}
+    fast = json_codec.dumps(data, pretty=True)
+
+    monkeypatch.setattr(json_codec, "orjson", None)
+
+    assert json_codec.dumps(data, pretty=True) == fast
+    assert fast.startswith(b'{\n  "_global": {\n')
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tvtelegrambingx.bot import position_utils
+
+
+def test_round_quantity_follows_changed_filters(monkeypatch, shared_loop):
+    filters = iter([{"stepSize": "0.1"}, {"stepSize": "1", "minQty": "2"}])
+
+    async def fake_contract_filters(symbol: str):
+        return next(filters)
+
+    monkeypatch.setattr(position_utils.bingx_client, "get_contract_filters", fake_contract_filters)
+
+    assert shared_loop.run_until_complete(position_utils.round_quantity("BTC-USDT", 1.25)) == 1.2
+    assert shared_loop.run_until_complete(position_utils.round_quantity("BTC-USDT", 1.25)) == 0.0
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+pytest.importorskip("telegram")
+
+from tvtelegrambingx.bot import telegram_bot
+from tvtelegrambingx.config_store import ConfigStore
+
+_PAYLOAD = {"symbol": "BTC-USDT", "action": "LONG_BUY"}
+
+
+@pytest.fixture
+def calls(monkeypatch, tmp_path, settings):
+    calls: list[str] = []
+    store = ConfigStore(tmp_path / "config.json")
+    store.set_global(auto_trade=True)
+
+    async def fake_execute_trade(*, symbol: str, action: str, chat_id: int) -> None:
+        calls.append(f"trade:{action}")
+
+    monkeypatch.setattr(telegram_bot, "CONFIG", store)
+    monkeypatch.setattr(telegram_bot, "SETTINGS", settings)
+    monkeypatch.setattr(telegram_bot, "BOT_ENABLED", True)
+    monkeypatch.setattr(telegram_bot, "is_within_schedule", lambda *args: True)
+    monkeypatch.setattr(telegram_bot, "execute_trade", fake_execute_trade)
+    return calls
+
+
+def test_auto_trade_runs_after_signal_message(monkeypatch, shared_loop, calls):
+    async def fake_send(symbol, actions, auto_enabled) -> None:
+        calls.append("message")
+
+    monkeypatch.setattr(telegram_bot, "_send_signal_message", fake_send)
+
+    shared_loop.run_until_complete(telegram_bot.handle_signal(dict(_PAYLOAD)))
+
+    assert calls == ["message", "trade:LONG_BUY"]
+
+
+def test_failed_signal_message_blocks_auto_trade(monkeypatch, shared_loop, calls):
+    async def failing_send(symbol, actions, auto_enabled) -> None:
+        raise RuntimeError("telegram down")
+
+    monkeypatch.setattr(telegram_bot, "_send_signal_message", failing_send)
+
+    with pytest.raises(RuntimeError):
+        shared_loop.run_until_complete(telegram_bot.handle_signal(dict(_PAYLOAD)))
+
+    assert calls == []
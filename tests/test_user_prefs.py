@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tvtelegrambingx.bot import user_prefs
+
+
+def test_set_global_skips_write_when_unchanged(monkeypatch, tmp_path):
+    path = tmp_path / "prefs.json"
+    monkeypatch.setattr(user_prefs, "_PATH", str(path))
+
+    assert user_prefs.set_global(1, leverage=5) == {"leverage": 5}
+    before = path.stat().st_ino
+
+    assert user_prefs.set_global(1, leverage="5") == {"leverage": 5}
+    assert path.stat().st_ino == before
+
+    user_prefs.set_global(1, margin_usdt=20)
+    assert path.stat().st_ino != before
+    assert user_prefs.get_effective(1, "btc-usdt") == {"leverage": 5, "margin_usdt": 20.0}
+
+
+def test_non_finite_values_in_file_do_not_drop_preferences(monkeypatch, tmp_path):
+    path = tmp_path / "prefs.json"
+    path.write_text(
+        '{"1:__GLOBAL__": {"margin_usdt": NaN}, "2:__GLOBAL__": {"leverage": 7}}',
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(user_prefs, "_PATH", str(path))
+
+    user_prefs.set_global(1, leverage=3)
+
+    assert user_prefs.get_global(2) == {"leverage": 7}
+    assert user_prefs.get_global(1)["leverage"] == 3
+
+
+def test_unknown_preference_fields_are_rejected():
+    assert user_prefs._build_updates(leverage="5", margin_usdt=None) == {"leverage": 5}
+
+    with pytest.raises(TypeError, match="levrage"):
+        user_prefs._build_updates(levrage=5)
@@ -33,8 +33,9 @@ def test_iter_actions_variants(raw, expected):
     assert list(_iter_actions(raw)) == expected
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_client():
+    # The app is stateless between requests; build the client once per module.
     return TestClient(server.app)
 
 
@@ -1,12 +1,31 @@
 """Telegram command handlers for global trade settings."""
 from __future__ import annotations
 
+import math
+from typing import Optional
+
 from telegram import Update
 from telegram.ext import ContextTypes
 
 from tvtelegrambingx.bot.user_prefs import get_global, set_global
 
 
+def _parse_float(raw: str) -> Optional[float]:
+    try:
+        value = float(raw)
+    except ValueError:
+        return None
+    # Reject nan/inf: they pass every range check and cannot be stored as JSON.
+    return value if math.isfinite(value) else None
+
+
+def _parse_int(raw: str) -> Optional[int]:
+    try:
+        return int(raw)
+    except ValueError:
+        return None
+
+
 def _format_percent(raw_value: object) -> str:
     if raw_value in {None, ""}:
         return "—"
@@ -45,11 +64,8 @@ async def cmd_margin(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         await message.reply_text(f"Globale Margin: {value} USDT")
         return
 
-    try:
-        margin = float(args[0])
-        if margin <= 0:
-            raise ValueError
-    except (ValueError, TypeError):
+    margin = _parse_float(args[0])
+    if margin is None or margin <= 0:
         await message.reply_text("Nutzung: /margin <USDT>  (z. B. /margin 2)")
         return
 
@@ -70,11 +86,8 @@ async def cmd_leverage(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         await message.reply_text(f"Globaler Leverage: {value}x")
         return
 
-    try:
-        leverage = int(args[0])
-        if not 1 <= leverage <= 125:
-            raise ValueError
-    except (ValueError, TypeError):
+    leverage = _parse_int(args[0])
+    if leverage is None or not 1 <= leverage <= 125:
         await message.reply_text("Nutzung: /leverage <x>  (z. B. /leverage 25)")
         return
 
@@ -98,11 +111,8 @@ async def cmd_sl(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         )
         return
 
-    try:
-        sl_percent = float(args[0])
-        if sl_percent <= 0:
-            raise ValueError
-    except (ValueError, TypeError):
+    sl_percent = _parse_float(args[0])
+    if sl_percent is None or sl_percent <= 0:
         await message.reply_text("Nutzung: /sl <Prozent>  (z. B. /sl 2.5)")
         return
 
@@ -174,11 +184,8 @@ async def cmd_tp_move(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         )
         return
 
-    try:
-        move_r = float(args[0])
-        if move_r <= 0:
-            raise ValueError
-    except (ValueError, TypeError):
+    move_r = _parse_float(args[0])
+    if move_r is None or move_r <= 0:
         await message.reply_text(
             "Nutzung: /tp_move <R>  (z. B. /tp_move 1.5)"
         )
@@ -207,11 +214,8 @@ async def cmd_tp_atr(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         )
         return
 
-    try:
-        atr_multiple = float(args[0])
-        if atr_multiple < 0:
-            raise ValueError
-    except (ValueError, TypeError):
+    atr_multiple = _parse_float(args[0])
+    if atr_multiple is None or atr_multiple < 0:
         await message.reply_text(
             "Nutzung: /tp_atr <ATR-Multiple>  (z. B. /tp_atr 1.0, /tp_atr 0 zum Deaktivieren)"
         )
@@ -244,11 +248,8 @@ async def cmd_tp_sell(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         )
         return
 
-    try:
-        sell_percent = float(args[0])
-        if sell_percent <= 0 or sell_percent > 100:
-            raise ValueError
-    except (ValueError, TypeError):
+    sell_percent = _parse_float(args[0])
+    if sell_percent is None or sell_percent <= 0 or sell_percent > 100:
         await message.reply_text(
             "Nutzung: /tp_sell <Prozent>  (z. B. /tp_sell 40)"
         )
@@ -277,11 +278,8 @@ async def cmd_tp2_move(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         )
         return
 
-    try:
-        move_r = float(args[0])
-        if move_r <= 0:
-            raise ValueError
-    except (ValueError, TypeError):
+    move_r = _parse_float(args[0])
+    if move_r is None or move_r <= 0:
         await message.reply_text(
             "Nutzung: /tp2_move <R>  (z. B. /tp2_move 2.0)"
         )
@@ -310,11 +308,8 @@ async def cmd_tp2_atr(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         )
         return
 
-    try:
-        atr_multiple = float(args[0])
-        if atr_multiple < 0:
-            raise ValueError
-    except (ValueError, TypeError):
+    atr_multiple = _parse_float(args[0])
+    if atr_multiple is None or atr_multiple < 0:
         await message.reply_text(
             "Nutzung: /tp2_atr <ATR-Multiple>  (z. B. /tp2_atr 1.5, /tp2_atr 0 zum Deaktivieren)"
         )
@@ -347,11 +342,8 @@ async def cmd_tp2_sell(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         )
         return
 
-    try:
-        sell_percent = float(args[0])
-        if sell_percent <= 0 or sell_percent > 100:
-            raise ValueError
-    except (ValueError, TypeError):
+    sell_percent = _parse_float(args[0])
+    if sell_percent is None or sell_percent <= 0 or sell_percent > 100:
         await message.reply_text(
             "Nutzung: /tp2_sell <Prozent>  (z. B. /tp2_sell 60)"
         )
@@ -414,11 +406,8 @@ async def cmd_tp3_move(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         )
         return
 
-    try:
-        move_r = float(args[0])
-        if move_r <= 0:
-            raise ValueError
-    except (ValueError, TypeError):
+    move_r = _parse_float(args[0])
+    if move_r is None or move_r <= 0:
         await message.reply_text(
             "Nutzung: /tp3_move <R>  (z. B. /tp3_move 3.0)"
         )
@@ -447,11 +436,8 @@ async def cmd_tp3_atr(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         )
         return
 
-    try:
-        atr_multiple = float(args[0])
-        if atr_multiple < 0:
-            raise ValueError
-    except (ValueError, TypeError):
+    atr_multiple = _parse_float(args[0])
+    if atr_multiple is None or atr_multiple < 0:
         await message.reply_text(
             "Nutzung: /tp3_atr <ATR-Multiple>  (z. B. /tp3_atr 2.0, /tp3_atr 0 zum Deaktivieren)"
         )
@@ -484,11 +470,8 @@ async def cmd_tp3_sell(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         )
         return
 
-    try:
-        sell_percent = float(args[0])
-        if sell_percent <= 0 or sell_percent > 100:
-            raise ValueError
-    except (ValueError, TypeError):
+    sell_percent = _parse_float(args[0])
+    if sell_percent is None or sell_percent <= 0 or sell_percent > 100:
         await message.reply_text(
             "Nutzung: /tp3_sell <Prozent>  (z. B. /tp3_sell 70)"
         )
@@ -517,11 +500,8 @@ async def cmd_tp4_move(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         )
         return
 
-    try:
-        move_r = float(args[0])
-        if move_r <= 0:
-            raise ValueError
-    except (ValueError, TypeError):
+    move_r = _parse_float(args[0])
+    if move_r is None or move_r <= 0:
         await message.reply_text(
             "Nutzung: /tp4_move <R>  (z. B. /tp4_move 4.0)"
         )
@@ -550,11 +530,8 @@ async def cmd_tp4_atr(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         )
         return
 
-    try:
-        atr_multiple = float(args[0])
-        if atr_multiple < 0:
-            raise ValueError
-    except (ValueError, TypeError):
+    atr_multiple = _parse_float(args[0])
+    if atr_multiple is None or atr_multiple < 0:
         await message.reply_text(
             "Nutzung: /tp4_atr <ATR-Multiple>  (z. B. /tp4_atr 2.5, /tp4_atr 0 zum Deaktivieren)"
         )
@@ -587,11 +564,8 @@ async def cmd_tp4_sell(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         )
         return
 
-    try:
-        sell_percent = float(args[0])
-        if sell_percent <= 0 or sell_percent > 100:
-            raise ValueError
-    except (ValueError, TypeError):
+    sell_percent = _parse_float(args[0])
+    if sell_percent is None or sell_percent <= 0 or sell_percent > 100:
         await message.reply_text(
             "Nutzung: /tp4_sell <Prozent>  (z. B. /tp4_sell 80)"
         )
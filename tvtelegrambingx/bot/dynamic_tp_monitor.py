@@ -6,8 +6,9 @@ import logging
 import math
 import time
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, Optional, Sequence, Tuple
+from typing import Dict, Sequence, Tuple
 
+from tvtelegrambingx.bot import position_utils
 from tvtelegrambingx.bot.user_prefs import get_effective
 from tvtelegrambingx.config import Settings
 from tvtelegrambingx.integrations import bingx_account, bingx_client
@@ -19,96 +20,25 @@ _CHECK_INTERVAL_SECONDS = 5.0
 _ATR_PERIODS = 14
 _ATR_INTERVAL = "1m"
 _ATR_CACHE_SECONDS = 30.0
-
-_QUANTITY_KEYS: Tuple[str, ...] = (
-    "positionAmt",
-    "positionAmount",
-    "holdVolume",
-    "positionVolume",
-    "volume",
-    "quantity",
-    "qty",
-)
-
-_ENTRY_PRICE_KEYS: Tuple[str, ...] = (
-    "entryPrice",
-    "avgPrice",
-    "avgEntryPrice",
-    "averagePrice",
-    "openPrice",
+# (level, R-multiple key, ATR key, sell percent key) for each TP step.
+_TP_LEVEL_FIELDS: Tuple[Tuple[int, str, str, str], ...] = (
+    (1, "tp_move_percent", "tp_move_atr", "tp_sell_percent"),
+    (2, "tp2_move_percent", "tp2_move_atr", "tp2_sell_percent"),
+    (3, "tp3_move_percent", "tp3_move_atr", "tp3_sell_percent"),
+    (4, "tp4_move_percent", "tp4_move_atr", "tp4_sell_percent"),
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class _TriggerState:
     entry_price: float
     triggered_levels: set[int] = field(default_factory=set)
 
 
 _TRIGGER_STATE: Dict[Tuple[str, str], _TriggerState] = {}
-_FILTER_CACHE: Dict[str, Tuple[float, float]] = {}
 _ATR_CACHE: Dict[str, Tuple[float, float]] = {}
 
 
-def _parse_chat_id(raw_value: object) -> Optional[int]:
-    if raw_value in {None, ""}:
-        return None
-    try:
-        return int(str(raw_value))
-    except (TypeError, ValueError):
-        LOGGER.warning("Ungültige TELEGRAM_CHAT_ID: %s", raw_value)
-        return None
-
-
-def _first_float(values: Iterable[object]) -> Optional[float]:
-    for raw_value in values:
-        if raw_value in (None, ""):
-            continue
-        try:
-            return float(raw_value)
-        except (TypeError, ValueError):
-            continue
-    return None
-
-
-async def _round_quantity(symbol: str, quantity: float) -> float:
-    if quantity <= 0:
-        return 0.0
-
-    cached = _FILTER_CACHE.get(symbol)
-    if cached is None:
-        filters = await bingx_client.get_contract_filters(symbol)
-        lot_step = _first_float(
-            [
-                (filters or {}).get("lot_step"),
-                (filters or {}).get("stepSize"),
-                (filters or {}).get("qty_step"),
-                (filters or {}).get("step"),
-            ]
-        )
-        min_qty = _first_float(
-            [
-                (filters or {}).get("min_qty"),
-                (filters or {}).get("minQty"),
-                (filters or {}).get("min_quantity"),
-            ]
-        )
-        lot_step = lot_step or 0.001
-        min_qty = min_qty or lot_step
-        _FILTER_CACHE[symbol] = (lot_step, min_qty)
-    else:
-        lot_step, min_qty = cached
-
-    lot_step = lot_step or 0.001
-    min_qty = min_qty or lot_step
-
-    rounded = math.floor(quantity / lot_step) * lot_step
-    rounded = round(rounded, 12)
-    if rounded < min_qty:
-        return 0.0
-    return rounded
-
-
 async def _notify_dynamic_tp(
     *,
     settings: Settings,
@@ -135,12 +65,12 @@ async def _notify_dynamic_tp(
         LOGGER.debug("Kein Telegram-Bot verfügbar für TP-Benachrichtigung")
         return
 
-    chat_id = _parse_chat_id(settings.telegram_chat_id)
+    chat_id = position_utils.parse_chat_id(settings.telegram_chat_id)
     if chat_id is None:
         LOGGER.debug("Keine TELEGRAM_CHAT_ID konfiguriert – Notification übersprungen")
         return
 
-    direction = "Long" if position_side.upper() == "LONG" else "Short"
+    direction = "Long" if position_side == "LONG" else "Short"
     atr_line = ""
     if atr_multiple > 0 and atr_percent > 0:
         atr_line = f"ATR-Trigger: {atr_multiple:.2f}x ({atr_percent:.2f}%)\n"
@@ -170,7 +100,7 @@ def _price_change_percent(
     if entry_price <= 0 or current_price <= 0:
         return 0.0
 
-    if position_side.upper() == "LONG":
+    if position_side == "LONG":
         return ((current_price - entry_price) / entry_price) * 100.0
     return ((entry_price - current_price) / entry_price) * 100.0
 
@@ -243,6 +173,7 @@ async def _maybe_reduce_position(
     sl_percent: float,
     triggers: Sequence[Tuple[int, float, float, float]],
 ) -> None:
+    # _process_positions passes position_side upper-cased ("LONG"/"SHORT").
     key = (symbol, position_side)
     state = _TRIGGER_STATE.get(key)
 
@@ -287,13 +218,13 @@ async def _maybe_reduce_position(
             continue
 
         target_qty = abs(quantity) * min(sell_percent, 100.0) / 100.0
-        target_qty = await _round_quantity(symbol, target_qty)
+        target_qty = await position_utils.round_quantity(symbol, target_qty)
         if target_qty <= 0:
             LOGGER.debug("Berechnete Verkaufsmenge zu klein für %s", symbol)
             state.triggered_levels.add(trigger_level)
             continue
 
-        order_side = "SELL" if position_side.upper() == "LONG" else "BUY"
+        order_side = "SELL" if position_side == "LONG" else "BUY"
 
         try:
             await bingx_client.place_order(
@@ -301,7 +232,7 @@ async def _maybe_reduce_position(
                 side=order_side,
                 qty=target_qty,
                 reduce_only=True,
-                position_side=position_side.upper(),
+                position_side=position_side,
             )
         except Exception:  # pragma: no cover - requires BingX failure scenario
             LOGGER.exception("Dynamischer TP-Order fehlgeschlagen für %s", symbol)
@@ -333,7 +264,7 @@ async def _process_positions(
     chat_id: int,
 ) -> None:
 
-    positions = await bingx_account.get_positions()
+    positions = await bingx_account.get_positions(share_inflight=True)
     active_keys: set[Tuple[str, str]] = set()
 
     for entry in positions:
@@ -347,104 +278,28 @@ async def _process_positions(
         if position_side not in {"LONG", "SHORT"}:
             continue
 
-        quantity = _first_float(entry.get(key) for key in _QUANTITY_KEYS)
+        quantity = position_utils.first_float(
+            entry.get(key) for key in position_utils.QUANTITY_KEYS
+        )
         if quantity is None or abs(quantity) <= 0:
             _TRIGGER_STATE.pop((symbol, position_side), None)
             continue
 
-        entry_price = _first_float(entry.get(key) for key in _ENTRY_PRICE_KEYS)
+        entry_price = position_utils.first_float(
+            entry.get(key) for key in position_utils.ENTRY_PRICE_KEYS
+        )
         if entry_price is None or entry_price <= 0:
             continue
 
         prefs = get_effective(chat_id, symbol)
-        sl_raw = prefs.get("sl_move_percent")
-        move_raw = prefs.get("tp_move_percent")
-        move_atr_raw = prefs.get("tp_move_atr")
-        sell_raw = prefs.get("tp_sell_percent")
-        move2_raw = prefs.get("tp2_move_percent")
-        move2_atr_raw = prefs.get("tp2_move_atr")
-        sell2_raw = prefs.get("tp2_sell_percent")
-        move3_raw = prefs.get("tp3_move_percent")
-        move3_atr_raw = prefs.get("tp3_move_atr")
-        sell3_raw = prefs.get("tp3_sell_percent")
-        move4_raw = prefs.get("tp4_move_percent")
-        move4_atr_raw = prefs.get("tp4_move_atr")
-        sell4_raw = prefs.get("tp4_sell_percent")
-
-        try:
-            sl_percent = float(sl_raw)
-        except (TypeError, ValueError):
-            sl_percent = 0.0
-
-        try:
-            move_r = float(move_raw)
-        except (TypeError, ValueError):
-            move_r = 0.0
-
-        try:
-            move_atr = float(move_atr_raw)
-        except (TypeError, ValueError):
-            move_atr = 0.0
-
-        try:
-            sell_percent = float(sell_raw)
-        except (TypeError, ValueError):
-            sell_percent = 0.0
-
-        try:
-            move2_r = float(move2_raw)
-        except (TypeError, ValueError):
-            move2_r = 0.0
-
-        try:
-            move2_atr = float(move2_atr_raw)
-        except (TypeError, ValueError):
-            move2_atr = 0.0
-
-        try:
-            sell2_percent = float(sell2_raw)
-        except (TypeError, ValueError):
-            sell2_percent = 0.0
-
-        try:
-            move3_r = float(move3_raw)
-        except (TypeError, ValueError):
-            move3_r = 0.0
-
-        try:
-            move3_atr = float(move3_atr_raw)
-        except (TypeError, ValueError):
-            move3_atr = 0.0
-
-        try:
-            sell3_percent = float(sell3_raw)
-        except (TypeError, ValueError):
-            sell3_percent = 0.0
-
-        try:
-            move4_r = float(move4_raw)
-        except (TypeError, ValueError):
-            move4_r = 0.0
-
-        try:
-            move4_atr = float(move4_atr_raw)
-        except (TypeError, ValueError):
-            move4_atr = 0.0
-
-        try:
-            sell4_percent = float(sell4_raw)
-        except (TypeError, ValueError):
-            sell4_percent = 0.0
-
+        sl_percent = position_utils.pref_float(prefs, "sl_move_percent")
         triggers = []
-        if sell_percent > 0 and (sl_percent > 0 and move_r > 0 or move_atr > 0):
-            triggers.append((1, move_r, move_atr, sell_percent))
-        if sell2_percent > 0 and (sl_percent > 0 and move2_r > 0 or move2_atr > 0):
-            triggers.append((2, move2_r, move2_atr, sell2_percent))
-        if sell3_percent > 0 and (sl_percent > 0 and move3_r > 0 or move3_atr > 0):
-            triggers.append((3, move3_r, move3_atr, sell3_percent))
-        if sell4_percent > 0 and (sl_percent > 0 and move4_r > 0 or move4_atr > 0):
-            triggers.append((4, move4_r, move4_atr, sell4_percent))
+        for level, move_key, atr_key, sell_key in _TP_LEVEL_FIELDS:
+            move_r = position_utils.pref_float(prefs, move_key)
+            move_atr = position_utils.pref_float(prefs, atr_key)
+            sell_percent = position_utils.pref_float(prefs, sell_key)
+            if sell_percent > 0 and (sl_percent > 0 and move_r > 0 or move_atr > 0):
+                triggers.append((level, move_r, move_atr, sell_percent))
 
         triggers.sort(key=lambda item: max(item[1], item[2]))
 
@@ -475,7 +330,7 @@ async def monitor_dynamic_tp(settings: Settings) -> None:
 
     while True:
         try:
-            chat_id = _parse_chat_id(settings.telegram_chat_id)
+            chat_id = position_utils.parse_chat_id(settings.telegram_chat_id)
             if chat_id is None:
                 await asyncio.sleep(_CHECK_INTERVAL_SECONDS)
                 continue
@@ -0,0 +1,89 @@
+"""Helpers shared by the position monitors."""
+from __future__ import annotations
+
+import logging
+import math
+from typing import Any, Iterable, Mapping, Optional, Tuple
+
+from tvtelegrambingx.integrations import bingx_client
+
+LOGGER = logging.getLogger(__name__)
+
+QUANTITY_KEYS: Tuple[str, ...] = (
+    "positionAmt",
+    "positionAmount",
+    "holdVolume",
+    "positionVolume",
+    "volume",
+    "quantity",
+    "qty",
+)
+
+ENTRY_PRICE_KEYS: Tuple[str, ...] = (
+    "entryPrice",
+    "avgPrice",
+    "avgEntryPrice",
+    "averagePrice",
+    "openPrice",
+)
+
+
+def parse_chat_id(raw_value: object) -> Optional[int]:
+    if raw_value in {None, ""}:
+        return None
+    try:
+        return int(str(raw_value))
+    except (TypeError, ValueError):
+        LOGGER.warning("Ungültige TELEGRAM_CHAT_ID: %s", raw_value)
+        return None
+
+
+def first_float(values: Iterable[object]) -> Optional[float]:
+    for raw_value in values:
+        if raw_value in (None, ""):
+            continue
+        try:
+            return float(raw_value)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def pref_float(prefs: Mapping[str, Any], key: str) -> float:
+    """Return ``prefs[key]`` as float, treating missing or invalid values as 0."""
+    try:
+        return float(prefs.get(key))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+async def round_quantity(symbol: str, quantity: float) -> float:
+    """Round ``quantity`` down to the symbol's lot step; 0 if below minimum."""
+    if quantity <= 0:
+        return 0.0
+
+    # bingx_client caches the filters per symbol for an hour.
+    filters = await bingx_client.get_contract_filters(symbol) or {}
+    lot_step = first_float(
+        [
+            filters.get("lot_step"),
+            filters.get("stepSize"),
+            filters.get("qty_step"),
+            filters.get("step"),
+        ]
+    )
+    min_qty = first_float(
+        [
+            filters.get("min_qty"),
+            filters.get("minQty"),
+            filters.get("min_quantity"),
+        ]
+    )
+    lot_step = lot_step or 0.001
+    min_qty = min_qty or lot_step
+
+    rounded = math.floor(quantity / lot_step) * lot_step
+    rounded = round(rounded, 12)
+    if rounded < min_qty:
+        return 0.0
+    return rounded
@@ -5,8 +5,9 @@ import asyncio
 import logging
 import math
 from dataclasses import dataclass
-from typing import Dict, Iterable, Optional, Tuple
+from typing import Dict, Tuple
 
+from tvtelegrambingx.bot import position_utils
 from tvtelegrambingx.bot.user_prefs import get_effective
 from tvtelegrambingx.config import Settings
 from tvtelegrambingx.integrations import bingx_account, bingx_client
@@ -16,26 +17,8 @@ LOGGER = logging.getLogger(__name__)
 
 _CHECK_INTERVAL_SECONDS = 5.0
 
-_QUANTITY_KEYS: Tuple[str, ...] = (
-    "positionAmt",
-    "positionAmount",
-    "holdVolume",
-    "positionVolume",
-    "volume",
-    "quantity",
-    "qty",
-)
-
-_ENTRY_PRICE_KEYS: Tuple[str, ...] = (
-    "entryPrice",
-    "avgPrice",
-    "avgEntryPrice",
-    "averagePrice",
-    "openPrice",
-)
-
-
-@dataclass
+
+@dataclass(slots=True)
 class _StopState:
     entry_price: float
     triggered: bool = False
@@ -44,66 +27,6 @@ class _StopState:
 
 
 _STOP_STATE: Dict[Tuple[str, str], _StopState] = {}
-_FILTER_CACHE: Dict[str, Tuple[float, float]] = {}
-
-
-def _parse_chat_id(raw_value: object) -> Optional[int]:
-    if raw_value in {None, ""}:
-        return None
-    try:
-        return int(str(raw_value))
-    except (TypeError, ValueError):
-        LOGGER.warning("Ungültige TELEGRAM_CHAT_ID: %s", raw_value)
-        return None
-
-
-def _first_float(values: Iterable[object]) -> Optional[float]:
-    for raw_value in values:
-        if raw_value in (None, ""):
-            continue
-        try:
-            return float(raw_value)
-        except (TypeError, ValueError):
-            continue
-    return None
-
-
-async def _round_quantity(symbol: str, quantity: float) -> float:
-    if quantity <= 0:
-        return 0.0
-
-    cached = _FILTER_CACHE.get(symbol)
-    if cached is None:
-        filters = await bingx_client.get_contract_filters(symbol)
-        lot_step = _first_float(
-            [
-                (filters or {}).get("lot_step"),
-                (filters or {}).get("stepSize"),
-                (filters or {}).get("qty_step"),
-                (filters or {}).get("step"),
-            ]
-        )
-        min_qty = _first_float(
-            [
-                (filters or {}).get("min_qty"),
-                (filters or {}).get("minQty"),
-                (filters or {}).get("min_quantity"),
-            ]
-        )
-        lot_step = lot_step or 0.001
-        min_qty = min_qty or lot_step
-        _FILTER_CACHE[symbol] = (lot_step, min_qty)
-    else:
-        lot_step, min_qty = cached
-
-    lot_step = lot_step or 0.001
-    min_qty = min_qty or lot_step
-
-    rounded = math.floor(quantity / lot_step) * lot_step
-    rounded = round(rounded, 12)
-    if rounded < min_qty:
-        return 0.0
-    return rounded
 
 
 async def _notify_stop_loss(
@@ -127,12 +50,12 @@ async def _notify_stop_loss(
         LOGGER.debug("Kein Telegram-Bot verfügbar für SL-Benachrichtigung")
         return
 
-    chat_id = _parse_chat_id(settings.telegram_chat_id)
+    chat_id = position_utils.parse_chat_id(settings.telegram_chat_id)
     if chat_id is None:
         LOGGER.debug("Keine TELEGRAM_CHAT_ID konfiguriert – Notification übersprungen")
         return
 
-    direction = "Long" if position_side.upper() == "LONG" else "Short"
+    direction = "Long" if position_side == "LONG" else "Short"
     message = (
         "⛔️ Stop-Loss ausgelöst\n"
         f"Symbol: {symbol}\n"
@@ -155,7 +78,7 @@ def _loss_percent_from_entry(
     if entry_price <= 0 or current_price <= 0:
         return 0.0
 
-    if position_side.upper() == "LONG":
+    if position_side == "LONG":
         return max(((entry_price - current_price) / entry_price) * 100.0, 0.0)
     return max(((current_price - entry_price) / entry_price) * 100.0, 0.0)
 
@@ -166,7 +89,7 @@ def _profit_percent_from_entry(
     if entry_price <= 0 or current_price <= 0:
         return 0.0
 
-    if position_side.upper() == "LONG":
+    if position_side == "LONG":
         return max(((current_price - entry_price) / entry_price) * 100.0, 0.0)
     return max(((entry_price - current_price) / entry_price) * 100.0, 0.0)
 
@@ -187,6 +110,7 @@ async def _maybe_close_position(
     tp2_sell_percent: float,
     sl_to_entry_after_tp2: bool,
 ) -> None:
+    # _process_positions passes position_side upper-cased ("LONG"/"SHORT").
     key = (symbol, position_side)
     state = _STOP_STATE.get(key)
 
@@ -247,12 +171,12 @@ async def _maybe_close_position(
 
     if sl_to_entry_after_tp2 and state.tp2_hit:
         stop_price = entry_price
-    elif position_side.upper() == "LONG":
+    elif position_side == "LONG":
         stop_price = entry_price * (1 - sl_percent / 100.0)
     else:
         stop_price = entry_price * (1 + sl_percent / 100.0)
 
-    if position_side.upper() == "LONG":
+    if position_side == "LONG":
         should_trigger = current_price <= stop_price
     else:
         should_trigger = current_price >= stop_price
@@ -260,13 +184,13 @@ async def _maybe_close_position(
     if state.triggered or not should_trigger:
         return
 
-    target_qty = await _round_quantity(symbol, abs(quantity))
+    target_qty = await position_utils.round_quantity(symbol, abs(quantity))
     if target_qty <= 0:
         LOGGER.debug("Berechnete SL-Menge zu klein für %s", symbol)
         state.triggered = True
         return
 
-    order_side = "SELL" if position_side.upper() == "LONG" else "BUY"
+    order_side = "SELL" if position_side == "LONG" else "BUY"
 
     try:
         await bingx_client.place_order(
@@ -274,7 +198,7 @@ async def _maybe_close_position(
             side=order_side,
             qty=target_qty,
             reduce_only=True,
-            position_side=position_side.upper(),
+            position_side=position_side,
         )
     except Exception:  # pragma: no cover - requires BingX failure scenario
         LOGGER.exception("Stop-Loss-Order fehlgeschlagen für %s", symbol)
@@ -298,7 +222,7 @@ async def _process_positions(
     chat_id: int,
 ) -> None:
 
-    positions = await bingx_account.get_positions()
+    positions = await bingx_account.get_positions(share_inflight=True)
     active_keys: set[Tuple[str, str]] = set()
 
     for entry in positions:
@@ -312,61 +236,28 @@ async def _process_positions(
         if position_side not in {"LONG", "SHORT"}:
             continue
 
-        quantity = _first_float(entry.get(key) for key in _QUANTITY_KEYS)
+        quantity = position_utils.first_float(
+            entry.get(key) for key in position_utils.QUANTITY_KEYS
+        )
         if quantity is None or abs(quantity) <= 0:
             _STOP_STATE.pop((symbol, position_side), None)
             continue
 
-        entry_price = _first_float(entry.get(key) for key in _ENTRY_PRICE_KEYS)
+        entry_price = position_utils.first_float(
+            entry.get(key) for key in position_utils.ENTRY_PRICE_KEYS
+        )
         if entry_price is None or entry_price <= 0:
             continue
 
         prefs = get_effective(chat_id, symbol)
-        sl_raw = prefs.get("sl_move_percent")
-        tp_move_raw = prefs.get("tp_move_percent")
-        tp_move_atr_raw = prefs.get("tp_move_atr")
-        tp_sell_raw = prefs.get("tp_sell_percent")
-        tp2_move_raw = prefs.get("tp2_move_percent")
-        tp2_move_atr_raw = prefs.get("tp2_move_atr")
-        tp2_sell_raw = prefs.get("tp2_sell_percent")
-        sl_to_entry_after_tp2_raw = prefs.get("sl_to_entry_after_tp2")
-
-        try:
-            sl_percent = float(sl_raw)
-        except (TypeError, ValueError):
-            sl_percent = 0.0
-
-        try:
-            tp1_move_r = float(tp_move_raw)
-        except (TypeError, ValueError):
-            tp1_move_r = 0.0
-
-        try:
-            tp1_move_atr = float(tp_move_atr_raw)
-        except (TypeError, ValueError):
-            tp1_move_atr = 0.0
-
-        try:
-            tp1_sell_percent = float(tp_sell_raw)
-        except (TypeError, ValueError):
-            tp1_sell_percent = 0.0
-
-        try:
-            tp2_move_r = float(tp2_move_raw)
-        except (TypeError, ValueError):
-            tp2_move_r = 0.0
-
-        try:
-            tp2_move_atr = float(tp2_move_atr_raw)
-        except (TypeError, ValueError):
-            tp2_move_atr = 0.0
-
-        try:
-            tp2_sell_percent = float(tp2_sell_raw)
-        except (TypeError, ValueError):
-            tp2_sell_percent = 0.0
-
-        sl_to_entry_after_tp2 = bool(sl_to_entry_after_tp2_raw)
+        sl_percent = position_utils.pref_float(prefs, "sl_move_percent")
+        tp1_move_r = position_utils.pref_float(prefs, "tp_move_percent")
+        tp1_move_atr = position_utils.pref_float(prefs, "tp_move_atr")
+        tp1_sell_percent = position_utils.pref_float(prefs, "tp_sell_percent")
+        tp2_move_r = position_utils.pref_float(prefs, "tp2_move_percent")
+        tp2_move_atr = position_utils.pref_float(prefs, "tp2_move_atr")
+        tp2_sell_percent = position_utils.pref_float(prefs, "tp2_sell_percent")
+        sl_to_entry_after_tp2 = bool(prefs.get("sl_to_entry_after_tp2"))
 
         if sl_percent <= 0:
             continue
@@ -400,7 +291,7 @@ async def monitor_stop_loss(settings: Settings) -> None:
 
     while True:
         try:
-            chat_id = _parse_chat_id(settings.telegram_chat_id)
+            chat_id = position_utils.parse_chat_id(settings.telegram_chat_id)
             if chat_id is None:
                 await asyncio.sleep(_CHECK_INTERVAL_SECONDS)
                 continue
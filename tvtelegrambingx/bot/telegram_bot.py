@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, Optional, Sequence
 
 import html
@@ -22,6 +23,7 @@ from telegram import (
 )
 from telegram.constants import ParseMode
 from telegram.ext import (
+    AIORateLimiter,
     Application,
     ApplicationBuilder,
     CallbackQueryHandler,
@@ -169,67 +171,58 @@ def _coerce_float(value: Any) -> Optional[float]:
         return None
 
 
+# Accepted spellings for boolean webhook fields, mapped to their value.
+_BOOL_TOKENS: Dict[str, bool] = {
+    **dict.fromkeys(("1", "true", "on", "yes", "ja", "an"), True),
+    **dict.fromkeys(("0", "false", "off", "no", "nein", "aus"), False),
+}
+
+# Argument spellings shared by the /auto and /schedule_* commands.
+_AUTO_ON_TOKENS = frozenset({"on", "ein", "true", "1"})
+_SCHEDULE_CLEAR_TOKENS = frozenset({"off", "clear", "none"})
+_SCHEDULE_RESET_TOKENS = frozenset({"reset", "env"})
+
+
+def _is_valid_override(field: str, value: float) -> bool:
+    if field in {"margin_usdt", "leverage"}:
+        return value > 0
+    if field == "sl_move_percent":
+        return value > 0
+    if field.endswith("_sell_percent"):
+        return 0 < value <= 100
+    return value >= 0
+
+
+def _parse_webhook_override(field: str, raw_value: Any) -> Any:
+    """Return the coerced value for ``field`` or ``None`` if it is unusable."""
+    if raw_value is None:
+        return None
+    if field == "sl_to_entry_after_tp2":
+        if isinstance(raw_value, bool):
+            return raw_value
+        return _BOOL_TOKENS.get(str(raw_value).strip().lower())
+    parsed = _coerce_float(raw_value)
+    if parsed is None or not _is_valid_override(field, parsed):
+        return None
+    if field == "leverage":
+        return int(parsed)
+    return parsed
+
+
 def _extract_webhook_overrides(payload: Dict[str, Any]) -> Dict[str, Any]:
     overrides: Dict[str, Any] = {}
 
-    def _is_valid(field: str, value: float) -> bool:
-        if field in {"margin_usdt", "leverage"}:
-            return value > 0
-        if field == "sl_move_percent":
-            return value > 0
-        if field.endswith("_sell_percent"):
-            return 0 < value <= 100
-        return value >= 0
-
     for field in _WEBHOOK_PREF_FIELDS:
-        raw_value = payload.get(field)
-        if raw_value is None:
-            continue
-        if field == "sl_to_entry_after_tp2":
-            if isinstance(raw_value, bool):
-                overrides[field] = raw_value
-                continue
-            text = str(raw_value).strip().lower()
-            if text in {"1", "true", "on", "yes", "ja", "an"}:
-                overrides[field] = True
-                continue
-            if text in {"0", "false", "off", "no", "nein", "aus"}:
-                overrides[field] = False
-                continue
-            continue
-        parsed = _coerce_float(raw_value)
-        if parsed is None or not _is_valid(field, parsed):
-            continue
-        if field == "leverage":
-            overrides[field] = int(parsed)
-            continue
-        overrides[field] = parsed
+        value = _parse_webhook_override(field, payload.get(field))
+        if value is not None:
+            overrides[field] = value
 
     for raw_field, target_field in _WEBHOOK_LEVEL_ALIASES.items():
-        if target_field in overrides:
+        if target_field in overrides or raw_field not in payload:
             continue
-        if raw_field not in payload:
-            continue
-        raw_value = payload.get(raw_field)
-        if target_field == "sl_to_entry_after_tp2":
-            if isinstance(raw_value, bool):
-                overrides[target_field] = raw_value
-                continue
-            text = str(raw_value).strip().lower()
-            if text in {"1", "true", "on", "yes", "ja", "an"}:
-                overrides[target_field] = True
-                continue
-            if text in {"0", "false", "off", "no", "nein", "aus"}:
-                overrides[target_field] = False
-                continue
-            continue
-        parsed = _coerce_float(raw_value)
-        if parsed is None or not _is_valid(target_field, parsed):
-            continue
-        if target_field == "leverage":
-            overrides[target_field] = int(parsed)
-            continue
-        overrides[target_field] = parsed
+        value = _parse_webhook_override(target_field, payload[raw_field])
+        if value is not None:
+            overrides[target_field] = value
 
     return overrides
 
@@ -243,19 +236,24 @@ ACTIVE_WINDOWS = []
 ACTIVE_DAYS = set()
 ACTIVE_DAYS_RAW: Optional[str] = None
 ACTIVE_HOURS_RAW: Optional[str] = None
-ALLOW_TRADE_ACTIONS = {
+ALLOW_TRADE_ACTIONS = frozenset({
     "ALLOW_TRADE",
     "TRADE_ON",
     "BOT_ON",
     "ENABLE_TRADE",
     "ENABLE_TRADING",
-}
-BLOCK_TRADE_ACTIONS = {
+})
+BLOCK_TRADE_ACTIONS = frozenset({
     "BLOCK_TRADE",
     "TRADE_OFF",
     "BOT_OFF",
     "DISABLE_TRADE",
     "DISABLE_TRADING",
+})
+# Gate token → resulting ``bot_enabled`` value, resolved with one lookup.
+_TRADE_GATE_TOKENS: Dict[str, bool] = {
+    **dict.fromkeys(ALLOW_TRADE_ACTIONS, True),
+    **dict.fromkeys(BLOCK_TRADE_ACTIONS, False),
 }
 
 
@@ -264,25 +262,33 @@ def configure(settings: Settings) -> None:
     global SETTINGS, BOT
     SETTINGS = settings
     BOT = Bot(token=settings.telegram_bot_token)
-    _refresh_schedule_cache()
-    _refresh_auto_trade_cache()
-    _refresh_bot_enabled()
+    _refresh_runtime_caches()
+
+
+def _refresh_runtime_caches() -> None:
+    """Refresh every cached toggle from a single read of the config file."""
+    data = CONFIG.get()
+    _refresh_schedule_cache(data)
+    _refresh_auto_trade_cache(data)
+    _refresh_bot_enabled(data)
 
 
-def _refresh_auto_trade_cache() -> None:
+def _refresh_auto_trade_cache(data: Optional[Dict[str, Any]] = None) -> None:
     global AUTO_TRADE
-    AUTO_TRADE = CONFIG.get_auto_trade()
+    AUTO_TRADE = CONFIG.get_auto_trade(data=data)
 
 
-def _refresh_bot_enabled() -> None:
+def _refresh_bot_enabled(data: Optional[Dict[str, Any]] = None) -> None:
     global BOT_ENABLED
-    BOT_ENABLED = CONFIG.get_bot_enabled()
+    BOT_ENABLED = CONFIG.get_bot_enabled(data=data)
 
 
-def _refresh_schedule_cache() -> None:
+def _refresh_schedule_cache(data: Optional[Dict[str, Any]] = None) -> None:
     if SETTINGS is None:
         return
-    config_data = CONFIG.get().get("_global", {})
+    if data is None:
+        data = CONFIG.get()
+    config_data = data.get("_global", {})
     if "trading_active_days" in config_data:
         days_value = config_data.get("trading_active_days")
     else:
@@ -304,7 +310,9 @@ def _refresh_schedule_cache() -> None:
         ACTIVE_WINDOWS = []
 
 
+@lru_cache(maxsize=1)
 def _menu_text_html() -> str:
+    # Built only from the static command tables above.
     lines = ["<b>📋 Befehle</b>"]
     for _, description, usage in _COMMAND_DEFINITIONS:
         lines.append(f"<code>{_safe_html(usage)}</code> – {_safe_html(description)}")
@@ -323,6 +331,18 @@ def _parse_chat_id(raw_chat_id: Any) -> Optional[int]:
         return None
 
 
+@lru_cache(maxsize=8)
+def _parse_configured_chat_id(raw_chat_id: str) -> Optional[int]:
+    return _parse_chat_id(raw_chat_id)
+
+
+def _signal_chat_id() -> Optional[int]:
+    """Return TELEGRAM_CHAT_ID from ``SETTINGS``, parsed once per value, not per signal."""
+    if SETTINGS is None:
+        return None
+    return _parse_configured_chat_id(SETTINGS.telegram_chat_id)
+
+
 def _format_margin(raw_value: Any) -> str:
     if raw_value in {None, ""}:
         return "2 USDT"
@@ -348,6 +368,21 @@ def _current_trade_settings(chat_id: Optional[int]) -> tuple[str, str]:
     return _format_margin(margin_value), _format_leverage(leverage_value)
 
 
+_SIGNAL_SEPARATOR = "---------------------------------------"
+_AUTO_TRADE_LABELS = {True: "Auto-Trade: 🟢 On", False: "Auto-Trade: 🔴 Off"}
+_DIRECTION_LABELS = {
+    "LONG_BUY": "Long öffnen",
+    "LONG_SELL": "Long schließen",
+    "SHORT_SELL": "Short öffnen",
+    "SHORT_BUY": "Short schließen",
+}
+# Label and callback prefix of each signal button, one tuple per keyboard row.
+_SIGNAL_BUTTON_ROWS = (
+    (("🟢 Long öffnen", "LONG_BUY_"), ("⚪️ Long schließen", "LONG_SELL_")),
+    (("🔴 Short öffnen", "SHORT_SELL_"), ("⚫️ Short schließen", "SHORT_BUY_")),
+)
+
+
 def _format_signal_message(
     symbol: str,
     margin_text: str,
@@ -355,12 +390,11 @@ def _format_signal_message(
     direction_texts: Sequence[str],
     auto_enabled: bool,
 ) -> str:
-    auto_text = "🟢 On" if auto_enabled else "🔴 Off"
     directions = list(direction_texts) or ["—"]
 
     lines = [
         f"📊 Signal - {_safe_html(_format_symbol(symbol))}",
-        "---------------------------------------",
+        _SIGNAL_SEPARATOR,
         f"Margin: {_safe_html(margin_text)}",
         f"Leverage: {_safe_html(leverage_text)}",
     ]
@@ -371,7 +405,7 @@ def _format_signal_message(
         lines.append("Richtung:")
         lines.extend(f"• {_safe_html(direction)}" for direction in directions)
 
-    lines.append(f"Auto-Trade: {_safe_html(auto_text)}")
+    lines.append(_AUTO_TRADE_LABELS[bool(auto_enabled)])
 
     return "\n".join(lines)
 
@@ -406,15 +440,9 @@ def _command_argument(message) -> Optional[str]:
 def _direction_from_action(action: str) -> str:
     action_upper = str(action or "").upper().strip()
 
-    mapping = {
-        "LONG_BUY": "Long öffnen",
-        "LONG_SELL": "Long schließen",
-        "SHORT_SELL": "Short öffnen",
-        "SHORT_BUY": "Short schließen",
-    }
-
-    if action_upper in mapping:
-        return mapping[action_upper]
+    label = _DIRECTION_LABELS.get(action_upper)
+    if label is not None:
+        return label
 
     if "SHORT" in action_upper and "BUY" in action_upper:
         return "Short schließen"
@@ -465,22 +493,21 @@ def _split_actions(actions: Sequence[str]) -> tuple[list[str], list[str], list[s
 
 
 async def _apply_trade_gate_actions(actions: Sequence[str]) -> list[str]:
+    global BOT_ENABLED
     remaining: list[str] = []
     toggled: Optional[bool] = None
 
     for action in actions:
-        normalized = _normalize_signal_action(action)
-        if normalized in ALLOW_TRADE_ACTIONS:
-            toggled = True
-            continue
-        if normalized in BLOCK_TRADE_ACTIONS:
-            toggled = False
+        gate = _TRADE_GATE_TOKENS.get(_normalize_signal_action(action))
+        if gate is not None:
+            toggled = gate
             continue
         remaining.append(action)
 
     if toggled is not None:
         CONFIG.set_global(bot_enabled=toggled)
-        _refresh_bot_enabled()
+        # The value was just written; no need to read the file back.
+        BOT_ENABLED = toggled
         bot = APPLICATION.bot if APPLICATION is not None else BOT
         if bot is not None and SETTINGS is not None:
             state_text = "🟢 erlaubt" if toggled else "🔴 blockiert"
@@ -495,8 +522,9 @@ async def _apply_trade_gate_actions(actions: Sequence[str]) -> list[str]:
 def _startup_greeting_text() -> str:
     """Return the minimal startup status banner for Telegram."""
 
-    _refresh_auto_trade_cache()
-    _refresh_bot_enabled()
+    data = CONFIG.get()
+    _refresh_auto_trade_cache(data)
+    _refresh_bot_enabled(data)
     auto_text = _safe_html("🟢" if AUTO_TRADE else "🔴")
     bot_text = _safe_html("🟢" if BOT_ENABLED else "🔴")
 
@@ -509,6 +537,11 @@ def _startup_greeting_text() -> str:
     )
 
 
+_COMMAND_MENU_CONCURRENCY = 5
+# Leave some headroom below Telegram's global limit of 30 messages per second.
+_TELEGRAM_MAX_RATE = 25
+
+
 async def _ensure_command_menu(
     bot: Bot,
     chat_id: Optional[int] = None,
@@ -531,8 +564,15 @@ async def _ensure_command_menu(
         language_codes.append(normalized)
         language_codes.append(normalized.lower())
     language_codes = list(dict.fromkeys(language_codes))
-    for scope in scopes:
-        for language_code in language_codes:
+    if chat_id is not None:
+        scopes.append(BotCommandScopeChat(chat_id))
+
+    # Each scope/language pair is an independent delete+set round trip; run
+    # them concurrently but keep a few in flight to stay clear of flood limits.
+    limiter = asyncio.Semaphore(_COMMAND_MENU_CONCURRENCY)
+
+    async def _update(scope, language_code: Optional[str]) -> None:
+        async with limiter:
             try:
                 await bot.delete_my_commands(scope=scope, language_code=language_code)
                 await bot.set_my_commands(
@@ -545,24 +585,14 @@ async def _ensure_command_menu(
                     language_code,
                     exc_info=True,
                 )
-    if chat_id is not None:
-        for language_code in language_codes:
-            try:
-                await bot.delete_my_commands(
-                    scope=BotCommandScopeChat(chat_id),
-                    language_code=language_code,
-                )
-                await bot.set_my_commands(
-                    commands,
-                    scope=BotCommandScopeChat(chat_id),
-                    language_code=language_code,
-                )
-            except Exception:  # pragma: no cover - network/telegram errors
-                LOGGER.warning(
-                    "Konnte Telegram-Befehle nicht aktualisieren (scope=chat, lang=%s)",
-                    language_code,
-                    exc_info=True,
-                )
+
+    await asyncio.gather(
+        *(
+            _update(scope, language_code)
+            for scope in scopes
+            for language_code in language_codes
+        )
+    )
 
 
 async def _reply_html(message, text: str):
@@ -655,7 +685,7 @@ async def auto_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
         symbol_key = command_part.split("@", 1)[0].replace("/auto_", "").upper()
         value = arg_part.strip().lower()
-        enabled = value in {"on", "ein", "true", "1"}
+        enabled = value in _AUTO_ON_TOKENS
         CONFIG.set_symbol(symbol_key, auto_trade=enabled)
         await message.reply_text(
             f"Auto-Trade für {symbol_key}: {'ON' if enabled else 'OFF'}"
@@ -667,7 +697,7 @@ async def auto_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         return
 
     value = context.args[0].lower()
-    enabled = value in {"on", "ein", "true", "1"}
+    enabled = value in _AUTO_ON_TOKENS
     CONFIG.set_global(auto_trade=enabled)
     _refresh_auto_trade_cache()
     await message.reply_text(f"Auto-Trade global: {'ON' if enabled else 'OFF'}")
@@ -724,12 +754,12 @@ async def schedule_days_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE)
             await _reply_html(message, _schedule_overview_text())
             return
         normalized = raw_value.strip().lower()
-        if normalized in {"off", "clear", "none"}:
+        if normalized in _SCHEDULE_CLEAR_TOKENS:
             CONFIG.set_global(trading_active_days="")
             _refresh_schedule_cache()
             await _reply_html(message, "✅ Trading-Tage: <code>alle</code>")
             return
-        if normalized in {"reset", "env"}:
+        if normalized in _SCHEDULE_RESET_TOKENS:
             CONFIG.clear_global("trading_active_days")
             _refresh_schedule_cache()
             await _reply_html(message, "✅ Trading-Tage zurückgesetzt (ENV).")
@@ -760,12 +790,12 @@ async def schedule_hours_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE)
             await _reply_html(message, _schedule_overview_text())
             return
         normalized = raw_value.strip().lower()
-        if normalized in {"off", "clear", "none"}:
+        if normalized in _SCHEDULE_CLEAR_TOKENS:
             CONFIG.set_global(trading_active_hours="")
             _refresh_schedule_cache()
             await _reply_html(message, "✅ Trading-Zeiten: <code>alle</code>")
             return
-        if normalized in {"reset", "env"}:
+        if normalized in _SCHEDULE_RESET_TOKENS:
             CONFIG.clear_global("trading_active_hours")
             _refresh_schedule_cache()
             await _reply_html(message, "✅ Trading-Zeiten zurückgesetzt (ENV).")
@@ -814,33 +844,31 @@ async def status_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
     config_data = CONFIG.get().get("_global", {})
     auto_text = "ON" if config_data.get("auto_trade") else "OFF"
     bot_text = "ON" if config_data.get("bot_enabled", True) else "OFF"
-    schedule_parts = []
-    days_text = ACTIVE_DAYS_RAW if ACTIVE_DAYS_RAW not in {None, ""} else "alle"
-    hours_text = ACTIVE_HOURS_RAW if ACTIVE_HOURS_RAW not in {None, ""} else "alle"
-    schedule_parts.append(f"Tage: <code>{_safe_html(days_text)}</code>")
-    schedule_parts.append(f"Zeiten: <code>{_safe_html(hours_text)}</code>")
-    schedule_text = "\n".join(schedule_parts)
-    status_text = (
-        f"{_safe_html(summary)}\n\n"
-        "<b>⚙️ Trading-Konfiguration</b>\n"
-        f"AutoTrade: <code>{_safe_html(auto_text)}</code>\n"
-        f"Bot aktiv: <code>{_safe_html(bot_text)}</code>"
+    days_text = ACTIVE_DAYS_RAW or "alle"
+    hours_text = ACTIVE_HOURS_RAW or "alle"
+    status_text = "\n".join(
+        (
+            f"{_safe_html(summary)}\n",
+            "<b>⚙️ Trading-Konfiguration</b>",
+            f"AutoTrade: <code>{_safe_html(auto_text)}</code>",
+            f"Bot aktiv: <code>{_safe_html(bot_text)}</code>",
+            f"Tage: <code>{_safe_html(days_text)}</code>",
+            f"Zeiten: <code>{_safe_html(hours_text)}</code>",
+        )
     )
-    if schedule_text:
-        status_text = f"{status_text}\n{schedule_text}"
     await _reply_html(message, status_text)
 
 
+@lru_cache(maxsize=256)
 def _build_signal_buttons(symbol: str) -> InlineKeyboardMarkup:
+    # Telegram objects are frozen after construction, so one markup per
+    # symbol can be shared between signal messages.
     buttons = [
         [
-            InlineKeyboardButton("🟢 Long öffnen", callback_data=f"LONG_BUY_{symbol}"),
-            InlineKeyboardButton("⚪️ Long schließen", callback_data=f"LONG_SELL_{symbol}"),
-        ],
-        [
-            InlineKeyboardButton("🔴 Short öffnen", callback_data=f"SHORT_SELL_{symbol}"),
-            InlineKeyboardButton("⚫️ Short schließen", callback_data=f"SHORT_BUY_{symbol}"),
-        ],
+            InlineKeyboardButton(label, callback_data=prefix + symbol)
+            for label, prefix in row
+        ]
+        for row in _SIGNAL_BUTTON_ROWS
     ]
     return InlineKeyboardMarkup(buttons)
 
@@ -857,12 +885,7 @@ async def _send_signal_message(
         LOGGER.error("No Telegram bot available to send messages")
         return
 
-    try:
-        chat_id = int(SETTINGS.telegram_chat_id)
-    except (TypeError, ValueError):
-        chat_id = None
-
-    margin_text, leverage_text = _current_trade_settings(chat_id)
+    margin_text, leverage_text = _current_trade_settings(_signal_chat_id())
     direction_texts = [_direction_from_action(action) for action in actions]
 
     text = _format_signal_message(
@@ -892,7 +915,11 @@ async def handle_signal(payload: Dict[str, Any]) -> None:
     symbol = payload.get("symbol")
     raw_actions = payload.get("actions")
     if isinstance(raw_actions, (list, tuple, set)):
-        actions = [str(action).upper() for action in raw_actions if str(action or "").strip()]
+        actions = []
+        for action in raw_actions:
+            text = str(action or "")
+            if text.strip():
+                actions.append(text.upper())
     else:
         action_value = payload.get("action")
         actions = [str(action_value).upper()] if action_value else []
@@ -910,8 +937,8 @@ async def handle_signal(payload: Dict[str, Any]) -> None:
         return
 
     overrides = _extract_webhook_overrides(payload)
+    chat_id = _signal_chat_id()
     if overrides:
-        chat_id = _parse_chat_id(SETTINGS.telegram_chat_id if SETTINGS else None)
         if chat_id is None:
             LOGGER.warning("Webhook overrides ignored; invalid chat id")
         else:
@@ -1014,22 +1041,25 @@ async def handle_signal(payload: Dict[str, Any]) -> None:
         )
 
     allowed_actions = close_actions if (not schedule_ok or not BOT_ENABLED) else trade_actions
+    # Notify first: if the signal message cannot be delivered, no order is
+    # placed, so a position never opens without the user seeing the signal.
     await _send_signal_message(symbol, allowed_actions, auto_enabled)
 
     already_executed = bool(payload.get("executed"))
 
     if auto_enabled and not already_executed:
-        try:
-            target_chat_id = int(SETTINGS.telegram_chat_id)
-        except (TypeError, ValueError):
-            LOGGER.exception("Invalid TELEGRAM_CHAT_ID configured")
+        if chat_id is None:
+            LOGGER.error("Invalid TELEGRAM_CHAT_ID configured")
             return
+        await _execute_auto_trades(symbol, allowed_actions, chat_id)
 
-        for action in allowed_actions:
-            try:
-                await execute_trade(symbol=symbol, action=action, chat_id=target_chat_id)
-            except Exception as exc:  # pragma: no cover - requires BingX failure scenarios
-                LOGGER.exception("Auto trade failed: symbol=%s action=%s", symbol, action)
+
+async def _execute_auto_trades(symbol: str, actions: Sequence[str], chat_id: int) -> None:
+    for action in actions:
+        try:
+            await execute_trade(symbol=symbol, action=action, chat_id=chat_id)
+        except Exception:  # pragma: no cover - requires BingX failure scenarios
+            LOGGER.exception("Auto trade failed: symbol=%s action=%s", symbol, action)
 
 
 async def on_button_click(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -1105,11 +1135,26 @@ async def on_error(update: object, context: ContextTypes.DEFAULT_TYPE) -> None:
         LOGGER.debug("Failed to send error notification to user", exc_info=True)
 
 
+def _build_rate_limiter() -> Optional[AIORateLimiter]:
+    """Throttle outgoing calls below Telegram's 30 msg/s if aiolimiter is installed."""
+    try:
+        return AIORateLimiter(overall_max_rate=_TELEGRAM_MAX_RATE, overall_time_period=1)
+    except RuntimeError:
+        LOGGER.debug("aiolimiter nicht installiert – kein Telegram-Rate-Limit aktiv")
+        return None
+
+
 def build_application(settings: Settings) -> Application:
     """Create the Telegram application and register handlers."""
-    application = ApplicationBuilder().token(settings.telegram_bot_token).build()
+    builder = ApplicationBuilder().token(settings.telegram_bot_token)
+    rate_limiter = _build_rate_limiter()
+    if rate_limiter is not None:
+        builder = builder.rate_limiter(rate_limiter)
+    application = builder.build()
     application.add_handler(CommandHandler("start", start))
-    application.add_handler(CommandHandler("help", help_cmd))
+    # Read-only views run as concurrent tasks so a slow BingX call does not
+    # hold up the following updates; toggles stay sequential.
+    application.add_handler(CommandHandler("help", help_cmd, block=False))
     application.add_handler(CommandHandler("margin", cmd_margin))
     application.add_handler(CommandHandler("leverage", cmd_leverage))
     application.add_handler(CommandHandler("sl", cmd_sl))
@@ -1127,7 +1172,7 @@ def build_application(settings: Settings) -> Application:
     application.add_handler(CommandHandler("tp4_atr", cmd_tp4_atr))
     application.add_handler(CommandHandler("tp4_sell", cmd_tp4_sell))
     application.add_handler(CommandHandler("set", cmd_set))
-    application.add_handler(CommandHandler("schedule", schedule_cmd))
+    application.add_handler(CommandHandler("schedule", schedule_cmd, block=False))
     application.add_handler(CommandHandler("schedule_days", schedule_days_cmd))
     application.add_handler(CommandHandler("schedule_hours", schedule_hours_cmd))
     application.add_handler(CommandHandler("schedule_reset", schedule_reset_cmd))
@@ -1138,7 +1183,7 @@ def build_application(settings: Settings) -> Application:
     application.add_handler(CommandHandler("manual", set_manual))
     application.add_handler(CommandHandler("botstart", bot_start))
     application.add_handler(CommandHandler("botstop", bot_stop))
-    application.add_handler(CommandHandler("status", status_cmd))
+    application.add_handler(CommandHandler("status", status_cmd, block=False))
     application.add_handler(CallbackQueryHandler(on_button_click))
     application.add_handler(MessageHandler(filters.COMMAND, unknown_cmd))
     application.add_error_handler(on_error)
@@ -1149,17 +1194,14 @@ async def run_telegram_bot(settings: Settings) -> None:
     """Bootstrap and run the Telegram bot."""
     global APPLICATION, SETTINGS, BOT
     SETTINGS = settings
-    _refresh_auto_trade_cache()
-    _refresh_bot_enabled()
-    _refresh_schedule_cache()
+    _refresh_runtime_caches()
     APPLICATION = build_application(settings)
     BOT = APPLICATION.bot
-    chat_id: Optional[int] = None
+    chat_id = _signal_chat_id()
     LOGGER.info("Starting Telegram bot polling")
     await APPLICATION.initialize()
     await APPLICATION.start()
     if BOT is not None:
-        chat_id = _parse_chat_id(settings.telegram_chat_id)
         await _ensure_command_menu(BOT, chat_id=chat_id)
         if chat_id is not None:
             try:
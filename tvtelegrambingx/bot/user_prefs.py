@@ -1,33 +1,55 @@
 """Persist global per-chat trading preferences."""
 from __future__ import annotations
 
-import json
 import os
 import threading
 from typing import Any, Dict
 
+from tvtelegrambingx.utils.files import atomic_write_bytes
+from tvtelegrambingx.utils.json_codec import dumps as _dumps
+from tvtelegrambingx.utils.json_codec import loads as _loads
+
 _LOCK = threading.Lock()
 _PATH = os.getenv("USER_PREFS_PATH", "./data/user_prefs.json")
+# Stored preference fields and the type each value is coerced to.
+_FIELD_TYPES = (
+    ("margin_usdt", float),
+    ("leverage", int),
+    ("sl_move_percent", float),
+    ("tp_move_percent", float),
+    ("tp_move_atr", float),
+    ("tp_sell_percent", float),
+    ("tp2_move_percent", float),
+    ("tp2_move_atr", float),
+    ("tp2_sell_percent", float),
+    ("tp3_move_percent", float),
+    ("tp3_move_atr", float),
+    ("tp3_sell_percent", float),
+    ("tp4_move_percent", float),
+    ("tp4_move_atr", float),
+    ("tp4_sell_percent", float),
+    ("sl_to_entry_after_tp2", bool),
+)
+_FIELD_NAMES = frozenset(field for field, _ in _FIELD_TYPES)
 
 
 def _load() -> Dict[str, Any]:
     os.makedirs(os.path.dirname(_PATH) or ".", exist_ok=True)
     if not os.path.exists(_PATH):
-        with open(_PATH, "w", encoding="utf-8") as handle:
-            handle.write("{}")
-    with open(_PATH, "r", encoding="utf-8") as handle:
-        try:
-            data = json.load(handle)
-        except json.JSONDecodeError:
-            data = {}
+        atomic_write_bytes(_PATH, b"{}")
+    with open(_PATH, "rb") as handle:
+        raw = handle.read()
+    try:
+        data = _loads(raw)
+    except ValueError:
+        data = {}
     if not isinstance(data, dict):
         data = {}
     return data
 
 
 def _save(data: Dict[str, Any]) -> None:
-    with open(_PATH, "w", encoding="utf-8") as handle:
-        json.dump(data, handle, ensure_ascii=False, indent=2)
+    atomic_write_bytes(_PATH, _dumps(data))
 
 
 def _key(chat_id: int, symbol: str | None = None) -> str:
@@ -71,28 +93,26 @@ def set_global(
         data = _load()
         key = _key(chat_id)
         current = data.get(key, {})
-        current.update(
-            _build_updates(
-                margin_usdt=margin_usdt,
-                leverage=leverage,
-                sl_move_percent=sl_move_percent,
-                tp_move_percent=tp_move_percent,
-                tp_move_atr=tp_move_atr,
-                tp_sell_percent=tp_sell_percent,
-                tp2_move_percent=tp2_move_percent,
-                tp2_move_atr=tp2_move_atr,
-                tp2_sell_percent=tp2_sell_percent,
-                tp3_move_percent=tp3_move_percent,
-                tp3_move_atr=tp3_move_atr,
-                tp3_sell_percent=tp3_sell_percent,
-                tp4_move_percent=tp4_move_percent,
-                tp4_move_atr=tp4_move_atr,
-                tp4_sell_percent=tp4_sell_percent,
-                sl_to_entry_after_tp2=sl_to_entry_after_tp2,
-            )
+        updates = _build_updates(
+            margin_usdt=margin_usdt,
+            leverage=leverage,
+            sl_move_percent=sl_move_percent,
+            tp_move_percent=tp_move_percent,
+            tp_move_atr=tp_move_atr,
+            tp_sell_percent=tp_sell_percent,
+            tp2_move_percent=tp2_move_percent,
+            tp2_move_atr=tp2_move_atr,
+            tp2_sell_percent=tp2_sell_percent,
+            tp3_move_percent=tp3_move_percent,
+            tp3_move_atr=tp3_move_atr,
+            tp3_sell_percent=tp3_sell_percent,
+            tp4_move_percent=tp4_move_percent,
+            tp4_move_atr=tp4_move_atr,
+            tp4_sell_percent=tp4_sell_percent,
+            sl_to_entry_after_tp2=sl_to_entry_after_tp2,
         )
-        data[key] = current
-        _save(data)
+        if _store(data, key, current, updates):
+            _save(data)
         return current.copy()
 
 
@@ -121,81 +141,49 @@ def set_symbol(
         data = _load()
         key = _key(chat_id, symbol)
         current = data.get(key, {})
-        current.update(
-            _build_updates(
-                margin_usdt=margin_usdt,
-                leverage=leverage,
-                sl_move_percent=sl_move_percent,
-                tp_move_percent=tp_move_percent,
-                tp_move_atr=tp_move_atr,
-                tp_sell_percent=tp_sell_percent,
-                tp2_move_percent=tp2_move_percent,
-                tp2_move_atr=tp2_move_atr,
-                tp2_sell_percent=tp2_sell_percent,
-                tp3_move_percent=tp3_move_percent,
-                tp3_move_atr=tp3_move_atr,
-                tp3_sell_percent=tp3_sell_percent,
-                tp4_move_percent=tp4_move_percent,
-                tp4_move_atr=tp4_move_atr,
-                tp4_sell_percent=tp4_sell_percent,
-                sl_to_entry_after_tp2=sl_to_entry_after_tp2,
-            )
+        updates = _build_updates(
+            margin_usdt=margin_usdt,
+            leverage=leverage,
+            sl_move_percent=sl_move_percent,
+            tp_move_percent=tp_move_percent,
+            tp_move_atr=tp_move_atr,
+            tp_sell_percent=tp_sell_percent,
+            tp2_move_percent=tp2_move_percent,
+            tp2_move_atr=tp2_move_atr,
+            tp2_sell_percent=tp2_sell_percent,
+            tp3_move_percent=tp3_move_percent,
+            tp3_move_atr=tp3_move_atr,
+            tp3_sell_percent=tp3_sell_percent,
+            tp4_move_percent=tp4_move_percent,
+            tp4_move_atr=tp4_move_atr,
+            tp4_sell_percent=tp4_sell_percent,
+            sl_to_entry_after_tp2=sl_to_entry_after_tp2,
         )
-        data[key] = current
-        _save(data)
+        if _store(data, key, current, updates):
+            _save(data)
         return current.copy()
 
 
-def _build_updates(
-    *,
-    margin_usdt: float | None = None,
-    leverage: int | None = None,
-    sl_move_percent: float | None = None,
-    tp_move_percent: float | None = None,
-    tp_move_atr: float | None = None,
-    tp_sell_percent: float | None = None,
-    tp2_move_percent: float | None = None,
-    tp2_move_atr: float | None = None,
-    tp2_sell_percent: float | None = None,
-    tp3_move_percent: float | None = None,
-    tp3_move_atr: float | None = None,
-    tp3_sell_percent: float | None = None,
-    tp4_move_percent: float | None = None,
-    tp4_move_atr: float | None = None,
-    tp4_sell_percent: float | None = None,
-    sl_to_entry_after_tp2: bool | None = None,
-) -> Dict[str, Any]:
-    updates: Dict[str, Any] = {}
-    if margin_usdt is not None:
-        updates["margin_usdt"] = float(margin_usdt)
-    if leverage is not None:
-        updates["leverage"] = int(leverage)
-    if sl_move_percent is not None:
-        updates["sl_move_percent"] = float(sl_move_percent)
-    if tp_move_percent is not None:
-        updates["tp_move_percent"] = float(tp_move_percent)
-    if tp_move_atr is not None:
-        updates["tp_move_atr"] = float(tp_move_atr)
-    if tp_sell_percent is not None:
-        updates["tp_sell_percent"] = float(tp_sell_percent)
-    if tp2_move_percent is not None:
-        updates["tp2_move_percent"] = float(tp2_move_percent)
-    if tp2_move_atr is not None:
-        updates["tp2_move_atr"] = float(tp2_move_atr)
-    if tp2_sell_percent is not None:
-        updates["tp2_sell_percent"] = float(tp2_sell_percent)
-    if tp3_move_percent is not None:
-        updates["tp3_move_percent"] = float(tp3_move_percent)
-    if tp3_move_atr is not None:
-        updates["tp3_move_atr"] = float(tp3_move_atr)
-    if tp3_sell_percent is not None:
-        updates["tp3_sell_percent"] = float(tp3_sell_percent)
-    if tp4_move_percent is not None:
-        updates["tp4_move_percent"] = float(tp4_move_percent)
-    if tp4_move_atr is not None:
-        updates["tp4_move_atr"] = float(tp4_move_atr)
-    if tp4_sell_percent is not None:
-        updates["tp4_sell_percent"] = float(tp4_sell_percent)
-    if sl_to_entry_after_tp2 is not None:
-        updates["sl_to_entry_after_tp2"] = bool(sl_to_entry_after_tp2)
-    return updates
+def _store(
+    data: Dict[str, Any], key: str, current: Dict[str, Any], updates: Dict[str, Any]
+) -> bool:
+    """Apply ``updates`` to ``current``; return False if nothing changed."""
+    if key in data and all(
+        field in current and current[field] == value for field, value in updates.items()
+    ):
+        return False
+    current.update(updates)
+    data[key] = current
+    return True
+
+
+def _build_updates(**values: Any) -> Dict[str, Any]:
+    unknown = values.keys() - _FIELD_NAMES
+    if unknown:
+        # Same error an unexpected keyword argument would raise.
+        raise TypeError(f"unknown preference field(s): {', '.join(sorted(unknown))}")
+    return {
+        field: cast(value)
+        for field, cast in _FIELD_TYPES
+        if (value := values.get(field)) is not None
+    }
@@ -5,6 +5,8 @@ import os
 from dataclasses import dataclass
 from typing import Optional
 
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+
 
 def _read_env(name: str, default: Optional[str] = None) -> Optional[str]:
     """Read an environment variable with optional `_FILE` indirection."""
@@ -22,7 +24,12 @@ def _read_env(name: str, default: Optional[str] = None) -> Optional[str]:
     return value
 
 
-@dataclass(frozen=True)
+def _is_truthy(value: Optional[str]) -> bool:
+    """Interpret an environment flag such as ``DRY_RUN=yes``."""
+    return (value or "").lower() in _TRUE_VALUES
+
+
+@dataclass(frozen=True, slots=True)
 class Settings:
     telegram_bot_token: str
     telegram_chat_id: str
@@ -82,11 +89,9 @@ def load_settings() -> Settings:
         if default_quantity <= 0:
             raise RuntimeError("BINGX_DEFAULT_QUANTITY muss größer als 0 sein")
 
-    dry_run = (_read_env("DRY_RUN", "0") or "0").lower() in {"1", "true", "yes", "on"}
-    webhook_enabled = (
-        (_read_first("TRADINGVIEW_WEBHOOK_ENABLED") or _read_env("ENABLE_WEBHOOK") or "0")
-        .lower()
-        in {"1", "true", "yes", "on"}
+    dry_run = _is_truthy(_read_env("DRY_RUN"))
+    webhook_enabled = _is_truthy(
+        _read_first("TRADINGVIEW_WEBHOOK_ENABLED") or _read_env("ENABLE_WEBHOOK")
     )
     webhook_route = (
         _read_first("TRADINGVIEW_WEBHOOK_ROUTE", "WEBHOOK_ROUTE")
@@ -113,12 +118,7 @@ def load_settings() -> Settings:
         "SSL_CA_CERTS_PATH",
     )
 
-    disable_weekends = (_read_env("TRADING_DISABLE_WEEKENDS", "0") or "0").lower() in {
-        "1",
-        "true",
-        "yes",
-        "on",
-    }
+    disable_weekends = _is_truthy(_read_env("TRADING_DISABLE_WEEKENDS"))
     active_hours = _read_env("TRADING_ACTIVE_HOURS")
     active_days = _read_env("TRADING_ACTIVE_DAYS")
 
@@ -1,11 +1,15 @@
 """Persistent configuration storage for runtime trading parameters."""
 from __future__ import annotations
 
-import json
+import copy
 import threading
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from tvtelegrambingx.utils.files import atomic_write_bytes
+from tvtelegrambingx.utils.json_codec import dumps as _dumps
+from tvtelegrambingx.utils.json_codec import loads as _loads
+
 _DEFAULT_CONFIG: Dict[str, Any] = {
     "_global": {
         "auto_trade": False,
@@ -15,36 +19,43 @@ _DEFAULT_CONFIG: Dict[str, Any] = {
 }
 
 
+def _default_config() -> Dict[str, Any]:
+    # Deep copy: callers mutate the nested dicts before writing them back.
+    return copy.deepcopy(_DEFAULT_CONFIG)
+
+
+def _already_set(current: Dict[str, Any], updates: Dict[str, Any]) -> bool:
+    return all(key in current and current[key] == value for key, value in updates.items())
+
+
 class ConfigStore:
     """Small JSON-backed key/value store for runtime configuration."""
 
-    def __init__(self, path: Optional[Path | str] = None) -> None:
+    def __init__(self, path: Optional[Path | str] = None, *, pretty: bool = False) -> None:
         base_path = Path(path) if path is not None else Path.home() / ".tvtelegrambingx_config.json"
         self._path = base_path
+        # Indented output is easier to read while debugging; compact otherwise.
+        self._pretty = pretty
         self._path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = threading.Lock()
         if not self._path.exists():
-            self._write(dict(_DEFAULT_CONFIG))
+            self._write(_default_config())
 
     def _read(self) -> Dict[str, Any]:
         with self._lock:
             try:
-                raw = self._path.read_text(encoding="utf-8")
+                raw = self._path.read_bytes()
             except FileNotFoundError:
-                data = dict(_DEFAULT_CONFIG)
-                self._path.parent.mkdir(parents=True, exist_ok=True)
-                self._path.write_text(
-                    json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False),
-                    encoding="utf-8",
-                )
+                data = _default_config()
+                atomic_write_bytes(self._path, _dumps(data, pretty=self._pretty))
                 return data
             except OSError:
-                return dict(_DEFAULT_CONFIG)
+                return _default_config()
 
             try:
-                data = json.loads(raw)
-            except json.JSONDecodeError:
-                data = dict(_DEFAULT_CONFIG)
+                data = _loads(raw)
+            except ValueError:
+                data = _default_config()
 
             if "_global" not in data or not isinstance(data["_global"], dict):
                 data["_global"] = {}
@@ -58,9 +69,7 @@ class ConfigStore:
 
     def _write(self, data: Dict[str, Any]) -> None:
         with self._lock:
-            self._path.parent.mkdir(parents=True, exist_ok=True)
-            serialized = json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False)
-            self._path.write_text(serialized, encoding="utf-8")
+            atomic_write_bytes(self._path, _dumps(data, pretty=self._pretty))
 
     def get(self) -> Dict[str, Any]:
         """Return the full configuration structure."""
@@ -68,23 +77,32 @@ class ConfigStore:
 
     def set_global(self, **kwargs: Any) -> None:
         data = self._read()
-        data["_global"].update({k: v for k, v in kwargs.items() if v is not None})
+        updates = {k: v for k, v in kwargs.items() if v is not None}
+        if _already_set(data["_global"], updates):
+            return
+        data["_global"].update(updates)
         self._write(data)
 
     def clear_global(self, *keys: str) -> None:
         data = self._read()
         if not keys:
             return
+        global_data = data.get("_global", {})
+        if not any(key in global_data for key in keys):
+            return
         for key in keys:
-            data.get("_global", {}).pop(key, None)
+            global_data.pop(key, None)
         self._write(data)
 
     def set_symbol(self, symbol: str, **kwargs: Any) -> None:
         data = self._read()
         data.setdefault("symbols", {})
         symbol_key = symbol.upper()
-        data["symbols"].setdefault(symbol_key, {})
-        data["symbols"][symbol_key].update({k: v for k, v in kwargs.items() if v is not None})
+        updates = {k: v for k, v in kwargs.items() if v is not None}
+        current = data["symbols"].get(symbol_key)
+        if current is not None and _already_set(current, updates):
+            return
+        data["symbols"].setdefault(symbol_key, {}).update(updates)
         self._write(data)
 
     def get_effective(self, symbol: str) -> Dict[str, Any]:
@@ -95,10 +113,16 @@ class ConfigStore:
         effective.update(symbol_data)
         return effective
 
-    def get_auto_trade(self, symbol: Optional[str] = None) -> bool:
-        """Return whether auto trading is enabled globally or for a symbol."""
+    def get_auto_trade(
+        self, symbol: Optional[str] = None, *, data: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Return whether auto trading is enabled globally or for a symbol.
 
-        data = self._read()
+        ``data`` may be a configuration already returned by :meth:`get`.
+        """
+
+        if data is None:
+            data = self._read()
         if symbol:
             symbol_key = symbol.upper()
             symbol_cfg = data.get("symbols", {}).get(symbol_key)
@@ -107,8 +131,12 @@ class ConfigStore:
 
         return bool(data.get("_global", {}).get("auto_trade", False))
 
-    def get_bot_enabled(self) -> bool:
-        """Return whether the bot should accept signals globally."""
+    def get_bot_enabled(self, *, data: Optional[Dict[str, Any]] = None) -> bool:
+        """Return whether the bot should accept signals globally.
 
-        data = self._read()
+        ``data`` may be a configuration already returned by :meth:`get`.
+        """
+
+        if data is None:
+            data = self._read()
         return bool(data.get("_global", {}).get("bot_enabled", True))
@@ -1,19 +1,29 @@
 """Helpers for retrieving BingX account state."""
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
 import logging
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 import httpx
 
 from tvtelegrambingx.config import Settings
+from tvtelegrambingx.utils.json_codec import loads as json_loads
 
 LOGGER = logging.getLogger(__name__)
 
 SETTINGS: Optional[Settings] = None
+# One pooled client for all account requests; the monitors poll every few
+# seconds, so a fresh client per call would redo the TLS handshake each time.
+_CLIENT: Optional[httpx.AsyncClient] = None
+# Close tasks for replaced clients; referenced so they are not collected early.
+_CLOSING: Set["asyncio.Task[None]"] = set()
+# Positions request currently in flight, so the monitors polling side by side
+# can share a single BingX call.
+_POSITIONS_INFLIGHT: Optional["asyncio.Future[List[Dict[str, Any]]]"] = None
 
 
 def _is_success_code(value: Any) -> bool:
@@ -30,9 +40,24 @@ def _is_success_code(value: Any) -> bool:
 
 
 def configure(settings: Settings) -> None:
-    """Store the shared settings for account requests."""
-    global SETTINGS
+    """Store the shared settings for account requests.
+
+    A pooled client from earlier settings is closed in the background.
+    """
+    global SETTINGS, _CLIENT
     SETTINGS = settings
+    previous, _CLIENT = _CLIENT, None
+    if previous is None or previous.is_closed:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Its connections belong to a loop that is no longer running.
+        LOGGER.debug("Dropping BingX account client without a running loop")
+        return
+    task = loop.create_task(previous.aclose())
+    _CLOSING.add(task)
+    task.add_done_callback(_CLOSING.discard)
 
 
 def _require_settings() -> Settings:
@@ -41,6 +66,27 @@ def _require_settings() -> Settings:
     return SETTINGS
 
 
+async def aclose() -> None:
+    """Close the pooled HTTP client, e.g. on application shutdown."""
+    global _CLIENT
+    if _CLIENT is not None and not _CLIENT.is_closed:
+        await _CLIENT.aclose()
+    _CLIENT = None
+
+
+def _get_client(settings: Settings) -> httpx.AsyncClient:
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            base_url=settings.bingx_base_url,
+            timeout=10.0,
+            # The monitors poll every 5 s, which is exactly httpx' default
+            # keep-alive expiry; hold idle connections a little longer.
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30.0),
+        )
+    return _CLIENT
+
+
 def _sign(secret: str, params: Dict[str, Any]) -> str:
     query = "&".join(f"{key}={value}" for key, value in sorted(params.items()))
     signature = hmac.new(secret.encode(), query.encode(), hashlib.sha256).hexdigest()
@@ -61,24 +107,57 @@ async def _signed_get(path: str, params: Dict[str, Any]) -> Dict[str, Any]:
     query = _sign(settings.bingx_api_secret, signed)
     headers = {"X-BX-APIKEY": settings.bingx_api_key}
 
-    async with httpx.AsyncClient(base_url=settings.bingx_base_url, timeout=10.0) as client:
-        response = await client.get(f"{path}?{query}", headers=headers)
+    response = await _get_client(settings).get(f"{path}?{query}", headers=headers)
+    if LOGGER.isEnabledFor(logging.DEBUG):
         LOGGER.debug("BingX signed GET %s: %s", path, response.text)
-        response.raise_for_status()
-        return response.json()
+    response.raise_for_status()
+    return json_loads(response.content)
 
 
 async def _public_get(path: str, params: Dict[str, Any]) -> Dict[str, Any]:
     settings = _require_settings()
-    async with httpx.AsyncClient(base_url=settings.bingx_base_url, timeout=10.0) as client:
-        response = await client.get(path, params=params)
+    response = await _get_client(settings).get(path, params=params)
+    if LOGGER.isEnabledFor(logging.DEBUG):
         LOGGER.debug("BingX public GET %s: %s", path, response.text)
-        response.raise_for_status()
-        return response.json()
+    response.raise_for_status()
+    return json_loads(response.content)
+
+
+async def get_positions(*, share_inflight: bool = False) -> List[Dict[str, Any]]:
+    """Return the open hedge-mode positions from BingX.
+
+    With ``share_inflight`` a request that is already running is awaited
+    instead of issuing a second one; other callers always fetch their own
+    snapshot and never publish it. Nothing is cached beyond that request,
+    so callers never see a snapshot older than one they would have fetched.
+    """
+    global _POSITIONS_INFLIGHT
+
+    if not share_inflight:
+        return list(await _load_positions())
+    if _POSITIONS_INFLIGHT is not None:
+        return list(await asyncio.shield(_POSITIONS_INFLIGHT))
+
+    future: "asyncio.Future[List[Dict[str, Any]]]" = asyncio.get_running_loop().create_future()
+    _POSITIONS_INFLIGHT = future
+    try:
+        positions = await _load_positions()
+    except BaseException as exc:
+        # Waiters only see ordinary errors; a cancelled leader must not cancel them.
+        if not isinstance(exc, Exception):
+            exc = RuntimeError("Positionsabfrage abgebrochen")
+        future.set_exception(exc)
+        future.exception()  # mark retrieved when nobody else was waiting
+        raise
+    else:
+        future.set_result(positions)
+        return list(positions)
+    finally:
+        if _POSITIONS_INFLIGHT is future:
+            _POSITIONS_INFLIGHT = None
 
 
-async def get_positions() -> List[Dict[str, Any]]:
-    """Return the open hedge-mode positions from BingX."""
+async def _load_positions() -> List[Dict[str, Any]]:
     payload = await _signed_get("/openApi/swap/v2/user/positions", {})
     if not payload:
         return []
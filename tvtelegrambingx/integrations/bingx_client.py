@@ -10,12 +10,16 @@ from typing import Any, Dict, Optional
 
 import httpx
 
+from tvtelegrambingx.utils.json_codec import loads as json_loads
+
 LOGGER = logging.getLogger(__name__)
 
 _ENV_API_KEY = os.getenv("BINGX_KEY") or os.getenv("BINGX_API_KEY")
 _ENV_API_SECRET = os.getenv("BINGX_SECRET") or os.getenv("BINGX_API_SECRET")
 _ENV_BASE_URL = os.getenv("BINGX_BASE_URL") or "https://open-api.bingx.com"
 _ENV_RECV_WINDOW = int(os.getenv("BINGX_RECV_WINDOW", "5000") or "5000")
+# Lot size and minimum notional change rarely; refetch them at most hourly.
+_FILTER_CACHE_TTL_SECONDS = 3600.0
 
 
 def _is_success_code(value: Any) -> bool:
@@ -38,10 +42,11 @@ class BingXClient:
         api_secret: Optional[str] = None,
         base_url: str | None = None,
         recv_window: int | None = None,
+        client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         self.api_key = api_key or _ENV_API_KEY or ""
         self.api_secret = api_secret or _ENV_API_SECRET or ""
-        self.base_url = base_url or _ENV_BASE_URL
+        self.base_url = (base_url or _ENV_BASE_URL).rstrip("/")
         self.recv_window = recv_window or _ENV_RECV_WINDOW
         self.logger = LOGGER
         self._time_offset_ms = 0
@@ -55,23 +60,40 @@ class BingXClient:
         self._sig_mode = "raw"
         # Preferred transport mode: "query" (params) or "form" (body data).
         self._tx_mode = "query"
+        # Shared HTTP client so every request reuses the same connection pool.
+        # Request paths are relative, so an injected client must carry the
+        # BingX ``base_url`` itself.
+        self._http: Optional[httpx.AsyncClient] = client
+        self._filter_cache: Dict[str, tuple[float, Dict[str, Any]]] = {}
+        self._cached_headers: Dict[str, str] = {}
+        self._cached_headers_key: Optional[str] = None
 
     @property
     def _client(self) -> httpx.AsyncClient:
-        if not hasattr(self, "__client") or getattr(self, "__client").is_closed:
+        if self._http is None or self._http.is_closed:
             timeout = httpx.Timeout(15.0)
-            self.__client = httpx.AsyncClient(timeout=timeout)
-        return self.__client
+            limits = httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30.0)
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=timeout,
+                limits=limits,
+            )
+        return self._http
 
     async def aclose(self) -> None:
-        if hasattr(self, "__client") and not self.__client.is_closed:
-            await self.__client.aclose()
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._http = None
 
     def _headers(self) -> Dict[str, str]:
-        base = {"X-BX-APIKEY": self.api_key} if self.api_key else {}
-        if base:
-            base.setdefault("Content-Type", "application/x-www-form-urlencoded")
-        return base
+        # Built once per API key instead of on every request.
+        if self._cached_headers_key != self.api_key:
+            base = {"X-BX-APIKEY": self.api_key} if self.api_key else {}
+            if base:
+                base["Content-Type"] = "application/x-www-form-urlencoded"
+            self._cached_headers = base
+            self._cached_headers_key = self.api_key
+        return self._cached_headers
 
     async def _sync_time(self) -> None:
         """Synchronise the local clock with the BingX server time."""
@@ -81,7 +103,7 @@ class BingXClient:
 
         try:
             response = await self._client.get(
-                f"{self.base_url}/openApi/swap/v2/server/time",
+                "/openApi/swap/v2/server/time",
                 timeout=5.0,
             )
         except Exception:  # pragma: no cover - network failure
@@ -92,7 +114,7 @@ class BingXClient:
             return
 
         try:
-            payload = response.json()
+            payload = json_loads(response.content)
         except ValueError:  # pragma: no cover - malformed response
             return
 
@@ -160,13 +182,12 @@ class BingXClient:
         if not self.api_key or not self.api_secret:
             raise RuntimeError("BingX credentials are not configured")
 
-        cleaned: Dict[str, Any] = params.copy()
+        cleaned: Dict[str, Any] = {
+            k: v for k, v in params.items() if v is not None and k != "signature"
+        }
         cleaned.setdefault("timestamp", self._now_ms())
         cleaned.setdefault("recvWindow", self.recv_window)
 
-        cleaned.pop("signature", None)
-        cleaned = {k: v for k, v in cleaned.items() if v is not None}
-
         encode, sort = self._sig_mode_flags(mode)
         if encode:
             payload = self._canonical_qs(cleaned, sort=sort)
@@ -181,6 +202,31 @@ class BingXClient:
         cleaned["signature"] = signature
         return cleaned
 
+    def _log_signed_request(
+        self,
+        path: str,
+        signed: Dict[str, Any],
+        sig_mode: str,
+        tx_mode: str,
+    ) -> None:
+        try:
+            encode, sort = self._sig_mode_flags(sig_mode)
+            qs_no_sig = self._serialize_params(
+                {k: v for k, v in signed.items() if k != "signature"},
+                encode=encode,
+                sort=sort,
+            )
+            self.logger.debug(
+                "POST %s?%s%s (sig=%s tx=%s)",
+                path,
+                qs_no_sig,
+                "&signature=<redacted>",
+                sig_mode,
+                tx_mode,
+            )
+        except Exception:  # pragma: no cover - logging failure
+            pass
+
     async def _post_signed(self, path: str, params: Dict[str, Any], timeout: float = 10.0):
         """POST request with signature handling and automatic fallback."""
 
@@ -194,35 +240,19 @@ class BingXClient:
             else:
                 signed = payload_params
 
-            try:
-                encode, sort = self._sig_mode_flags(sig_mode)
-                qs_no_sig = self._serialize_params(
-                    {k: v for k, v in signed.items() if k != "signature"},
-                    encode=encode,
-                    sort=sort,
-                )
-                suffix = "&signature=<redacted>"
-                self.logger.debug(
-                    "POST %s?%s%s (sig=%s tx=%s)",
-                    path,
-                    qs_no_sig,
-                    suffix,
-                    sig_mode,
-                    tx_mode,
-                )
-            except Exception:  # pragma: no cover - logging failure
-                pass
+            # The redacted query string is only needed for debug output.
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self._log_signed_request(path, signed, sig_mode, tx_mode)
 
-            url = f"{self.base_url}{path}"
             if tx_mode == "form":
                 return await self._client.post(
-                    url,
+                    path,
                     data=signed,
                     headers=self._headers(),
                     timeout=timeout,
                 )
             return await self._client.post(
-                url,
+                path,
                 params=signed,
                 headers=self._headers(),
                 timeout=timeout,
@@ -236,8 +266,12 @@ class BingXClient:
         def _is_mismatch(resp: httpx.Response) -> bool:
             if resp.status_code != 200:
                 return False
+            # Callers decode the body again; only parse it here when the
+            # mismatch code can actually be present.
+            if b"100001" not in resp.content:
+                return False
             try:
-                payload = resp.json()
+                payload = json_loads(resp.content)
             except ValueError:
                 return False
             return isinstance(payload, dict) and str(payload.get("code")) == "100001"
@@ -327,14 +361,15 @@ class BingXClient:
     async def _public_get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
         LOGGER.debug("BingX GET %s params=%s", path, params)
         response = await self._client.get(
-            f"{self.base_url}{path}",
+            path,
             params=params,
             headers=self._headers(),
             timeout=10.0,
         )
-        LOGGER.debug("BingX GET %s → %s %s", path, response.status_code, response.text)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("BingX GET %s → %s %s", path, response.status_code, response.text)
         response.raise_for_status()
-        return response.json()
+        return json_loads(response.content)
 
     async def get_latest_price(self, symbol: str) -> float:
         data = await self._public_get("/openApi/swap/v2/quote/price", {"symbol": symbol})
@@ -371,6 +406,10 @@ class BingXClient:
         return contract
 
     async def get_contract_filters(self, symbol: str) -> Dict[str, Any]:
+        cached = self._filter_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] < _FILTER_CACHE_TTL_SECONDS:
+            return dict(cached[1])
+
         contract = await self.get_contract(symbol)
 
         lot_step_raw = (
@@ -400,12 +439,14 @@ class BingXClient:
         except (TypeError, ValueError):
             min_notional = 5.0
 
-        return {
+        filters = {
             "lot_step": lot_step,
             "min_qty": min_qty,
             "min_notional": min_notional,
             "raw_contract": contract,
         }
+        self._filter_cache[symbol] = (time.monotonic(), filters)
+        return dict(filters)
 
     async def set_leverage(
         self,
@@ -500,7 +541,7 @@ class BingXClient:
                 continue
 
             try:
-                payload = response.json()
+                payload = json_loads(response.content)
             except ValueError:
                 continue
 
@@ -557,7 +598,7 @@ class BingXClient:
             timeout=10.0,
         )
         response.raise_for_status()
-        payload = response.json()
+        payload = json_loads(response.content)
         if not _is_success_code(payload.get("code")):
             msg = payload.get("msg") or payload
             raise RuntimeError(f"BingX Order abgelehnt: {msg}")
@@ -568,6 +609,11 @@ class BingXClient:
 _CLIENT = BingXClient()
 
 
+async def aclose() -> None:
+    """Close the shared client's connection pool."""
+    await _CLIENT.aclose()
+
+
 async def place_order(
     symbol: str,
     side: str,
@@ -4,19 +4,24 @@ import asyncio
 import logging
 from contextlib import suppress
 
-import uvicorn
 from tvtelegrambingx.bot.dynamic_tp_monitor import monitor_dynamic_tp
 from tvtelegrambingx.bot.stop_loss_monitor import monitor_stop_loss
 from tvtelegrambingx.bot.telegram_bot import configure as configure_telegram
 from tvtelegrambingx.bot.telegram_bot import run_telegram_bot
 from tvtelegrambingx.config import load_settings
+from tvtelegrambingx.integrations.bingx_account import aclose as close_account_client
 from tvtelegrambingx.integrations.bingx_account import configure as configure_account
-from tvtelegrambingx.webhook.server import app as webhook_app
+from tvtelegrambingx.integrations.bingx_client import aclose as close_bingx_client
 
 LOGGER = logging.getLogger(__name__)
 
 
 async def _run_webhook(settings) -> None:
+    # Imported here so bots without the webhook never load FastAPI/uvicorn.
+    import uvicorn
+
+    from tvtelegrambingx.webhook.server import app as webhook_app
+
     if settings.tradingview_ssl_certfile and not settings.tradingview_ssl_keyfile:
         raise RuntimeError(
             "TRADINGVIEW_WEBHOOK_SSL_KEYFILE is required when TRADINGVIEW_WEBHOOK_SSL_CERTFILE is set"
@@ -73,9 +78,27 @@ async def amain() -> None:
         await asyncio.gather(*tasks)
     except asyncio.CancelledError:
         pass
+    finally:
+        # Release the pooled BingX connections instead of leaving them to GC.
+        await asyncio.gather(
+            close_account_client(),
+            close_bingx_client(),
+            return_exceptions=True,
+        )
+
+
+def _install_event_loop_policy() -> None:
+    """Use uvloop when it is installed; it is an optional speed-up."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    LOGGER.debug("Using uvloop event loop")
 
 
 def main() -> None:
+    _install_event_loop_policy()
     with suppress(KeyboardInterrupt):
         asyncio.run(amain())
 
@@ -1,20 +1,12 @@
 """Helpers for normalising signal actions."""
 from __future__ import annotations
 
+from functools import lru_cache
 
-SIDE_MAP_KEYS = {
-    "LONG_OPEN",
-    "LONG_BUY",
-    "LONG_CLOSE",
-    "LONG_SELL",
-    "SHORT_OPEN",
-    "SHORT_SELL",
-    "SHORT_CLOSE",
-    "SHORT_BUY",
-}
 
-OPEN_ACTIONS = {"LONG_OPEN", "LONG_BUY", "SHORT_OPEN", "SHORT_SELL"}
-CLOSE_ACTIONS = {"LONG_CLOSE", "LONG_SELL", "SHORT_CLOSE", "SHORT_BUY"}
+OPEN_ACTIONS = frozenset({"LONG_OPEN", "LONG_BUY", "SHORT_OPEN", "SHORT_SELL"})
+CLOSE_ACTIONS = frozenset({"LONG_CLOSE", "LONG_SELL", "SHORT_CLOSE", "SHORT_BUY"})
+SIDE_MAP_KEYS = OPEN_ACTIONS | CLOSE_ACTIONS
 
 
 def canonical_action(action: str | None) -> str | None:
@@ -22,8 +14,13 @@ def canonical_action(action: str | None) -> str | None:
 
     if not action:
         return None
+    # Webhook payloads may carry any JSON type; only cache the string form.
+    return _canonical_action(str(action))
 
-    normalized = str(action).upper().replace("-", "_").replace("/", "_")
+
+@lru_cache(maxsize=128)
+def _canonical_action(action: str) -> str | None:
+    normalized = action.upper().replace("-", "_").replace("/", "_")
     normalized = "_".join(part for part in normalized.split("_") if part)
 
     if normalized in SIDE_MAP_KEYS:
@@ -42,9 +39,9 @@ def canonical_action(action: str | None) -> str | None:
     if "LONG" in normalized and "CLOSE" in normalized:
         return "LONG_SELL"
 
-    if normalized in {"LONG", "BUY"}:
+    if normalized in ("LONG", "BUY"):
         return "LONG_BUY"
-    if normalized in {"SHORT", "SELL"}:
+    if normalized in ("SHORT", "SELL"):
         return "SHORT_SELL"
 
     return None
@@ -0,0 +1,57 @@
+"""Small filesystem helpers shared by the JSON-backed stores."""
+from __future__ import annotations
+
+import os
+import secrets
+from pathlib import Path
+
+
+def atomic_write_bytes(path: Path | str, data: bytes) -> None:
+    """Write ``data`` to ``path`` so readers never observe a partial file.
+
+    The data goes to a temporary file in the same directory first and is then
+    flushed to disk and then moved over the target with :func:`os.replace`,
+    which is atomic on POSIX and Windows. New files get the usual 0644 (minus umask); an existing
+    target keeps its permissions.
+    """
+
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    view = memoryview(data)
+    tmp_name = target.with_name(f".{target.name}.{secrets.token_hex(6)}.tmp")
+    # Not mkstemp: its 0600 mode would survive os.replace and lock out readers.
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp_name, flags, 0o644)
+    try:
+        try:
+            os.chmod(tmp_name, target.stat().st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        # The files are small: one unbuffered write usually covers them.
+        try:
+            while view:
+                view = view[os.write(fd, view):]
+            # Without this a power loss can leave the renamed file empty.
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_name, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    _fsync_directory(target.parent)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist the rename itself; directories cannot be opened on Windows."""
+
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
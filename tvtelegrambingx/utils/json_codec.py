@@ -0,0 +1,58 @@
+"""JSON encoding/decoding that uses :mod:`orjson` when it is installed."""
+from __future__ import annotations
+
+import json
+import math
+from typing import Any
+
+try:  # pragma: no cover - depends on the environment
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode ``data``; raises :class:`ValueError` on malformed input."""
+
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which stdlib json wrote and accepts.
+            pass
+    return json.loads(data)
+
+
+def dumps(data: Any, *, pretty: bool = False) -> bytes:
+    """Encode ``data`` as compact UTF-8 JSON with sorted keys.
+
+    ``pretty`` indents by two spaces for debugging. Non-finite floats are
+    written as ``null`` by both backends, so a file reads back the same
+    whichever one wrote it.
+    """
+
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(
+        _without_non_finite(data),
+        sort_keys=True,
+        ensure_ascii=False,
+        indent=2 if pretty else None,
+        separators=(",", ": ") if pretty else (",", ":"),
+        allow_nan=False,
+    ).encode("utf-8")
+
+
+def _without_non_finite(value: Any) -> Any:
+    """Replace NaN/Infinity with ``None`` the way orjson encodes them."""
+
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _without_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_without_non_finite(item) for item in value]
+    return value
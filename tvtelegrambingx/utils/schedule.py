@@ -2,11 +2,47 @@
 from __future__ import annotations
 
 from datetime import datetime, time
-from typing import Iterable, List, Optional, Sequence, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 TimeWindow = Tuple[time, time]
 WeekdaySet = Set[int]
 
+# Accepted weekday spellings (English and German) mapped to datetime.weekday().
+_WEEKDAY_TOKENS: Dict[str, int] = {
+    "mon": 0,
+    "monday": 0,
+    "mo": 0,
+    "montag": 0,
+    "tue": 1,
+    "tues": 1,
+    "tuesday": 1,
+    "di": 1,
+    "dienstag": 1,
+    "wed": 2,
+    "weds": 2,
+    "wednesday": 2,
+    "mi": 2,
+    "mittwoch": 2,
+    "thu": 3,
+    "thur": 3,
+    "thurs": 3,
+    "thursday": 3,
+    "do": 3,
+    "donnerstag": 3,
+    "fri": 4,
+    "friday": 4,
+    "fr": 4,
+    "freitag": 4,
+    "sat": 5,
+    "saturday": 5,
+    "sa": 5,
+    "samstag": 5,
+    "sun": 6,
+    "sunday": 6,
+    "so": 6,
+    "sonntag": 6,
+}
+
 
 def _parse_time(value: str) -> time:
     try:
@@ -53,41 +89,6 @@ def parse_active_days(raw_value: Optional[str]) -> WeekdaySet:
     if raw_value in {None, ""}:
         return set()
 
-    normalized_map = {
-        "mon": 0,
-        "monday": 0,
-        "mo": 0,
-        "montag": 0,
-        "tue": 1,
-        "tues": 1,
-        "tuesday": 1,
-        "di": 1,
-        "dienstag": 1,
-        "wed": 2,
-        "weds": 2,
-        "wednesday": 2,
-        "mi": 2,
-        "mittwoch": 2,
-        "thu": 3,
-        "thur": 3,
-        "thurs": 3,
-        "thursday": 3,
-        "do": 3,
-        "donnerstag": 3,
-        "fri": 4,
-        "friday": 4,
-        "fr": 4,
-        "freitag": 4,
-        "sat": 5,
-        "saturday": 5,
-        "sa": 5,
-        "samstag": 5,
-        "sun": 6,
-        "sunday": 6,
-        "so": 6,
-        "sonntag": 6,
-    }
-
     days: WeekdaySet = set()
     for part in raw_value.split(","):
         token = part.strip().lower()
@@ -95,23 +96,23 @@ def parse_active_days(raw_value: Optional[str]) -> WeekdaySet:
             continue
         if "-" in token:
             start_raw, end_raw = [item.strip() for item in token.split("-", 1)]
-            if start_raw not in normalized_map or end_raw not in normalized_map:
+            if start_raw not in _WEEKDAY_TOKENS or end_raw not in _WEEKDAY_TOKENS:
                 raise ValueError(
                     "Ungültiger Wochentag im Bereich. Beispiel: mon-fri oder mo-fr."
                 )
-            start = normalized_map[start_raw]
-            end = normalized_map[end_raw]
+            start = _WEEKDAY_TOKENS[start_raw]
+            end = _WEEKDAY_TOKENS[end_raw]
             if start <= end:
                 days.update(range(start, end + 1))
             else:
                 days.update(range(start, 7))
                 days.update(range(0, end + 1))
             continue
-        if token not in normalized_map:
+        if token not in _WEEKDAY_TOKENS:
             raise ValueError(
                 "Ungültiger Wochentag. Erlaubt: mon..sun, mo..so, montag..sonntag."
             )
-        days.add(normalized_map[token])
+        days.add(_WEEKDAY_TOKENS[token])
 
     return days
 
@@ -1,3 +1,7 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
 def norm_symbol(s: str) -> str:
     s = (s or "").upper().replace("_", "-")
     if s.endswith("USDT") and "-" not in s:
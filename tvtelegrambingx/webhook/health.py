@@ -0,0 +1,43 @@
+"""ASGI wrapper answering health probes before they reach FastAPI."""
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Dict
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+HEALTH_PATH = "/health"
+_HEALTH_BODY = b'{"ok":true}'
+_HEALTH_START = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers": [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_HEALTH_BODY)).encode("ascii")),
+    ],
+}
+_HEALTH_RESPONSE = {"type": "http.response.body", "body": _HEALTH_BODY}
+
+
+class HealthCheckInterceptor:
+    """Serve ``GET /health`` with a prebuilt response and forward everything else.
+
+    Uptime probes hit the health route far more often than TradingView hits
+    the webhook, so they skip routing and the middleware stack entirely.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and scope["path"] == HEALTH_PATH
+            and scope.get("method") == "GET"
+        ):
+            await send(_HEALTH_START)
+            await send(_HEALTH_RESPONSE)
+            return
+        await self.app(scope, receive, send)
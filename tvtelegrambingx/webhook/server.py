@@ -10,8 +10,9 @@ from typing import Iterable, List
 from fastapi import FastAPI, HTTPException, Request
 
 from tvtelegrambingx.bot.telegram_bot import handle_signal
+from tvtelegrambingx.webhook.health import HealthCheckInterceptor
 
-app = FastAPI()
+api = FastAPI()
 SECRET = os.getenv("WEBHOOK_SECRET", "12345689")
 _PREF_FIELDS = (
     "margin_usdt",
@@ -54,6 +55,8 @@ _ORDER_LEVEL_FIELDS = (
     "tp4_sell",
 )
 
+_FORWARDED_FIELDS = _PREF_FIELDS + _ORDER_LEVEL_FIELDS
+
 _SETTINGS_CONTAINER_FIELDS = (
     "trade_settings",
     "settings",
@@ -61,7 +64,7 @@ _SETTINGS_CONTAINER_FIELDS = (
 )
 
 
-@app.get("/health")
+@api.get("/health")
 async def health():
     return {"ok": True}
 
@@ -112,7 +115,7 @@ def _iter_actions(raw: object) -> List[str]:
     return _dedupe_preserve_order(actions)
 
 
-@app.post("/tradingview-webhook")
+@api.post("/tradingview-webhook")
 async def tradingview_webhook(req: Request):
     try:
         body = await req.json()
@@ -137,13 +140,15 @@ async def tradingview_webhook(req: Request):
         "timestamp": int(time.time()),
     }
     for source in settings_sources:
-        for field in _PREF_FIELDS:
-            if field in source:
-                payload[field] = source.get(field)
-        for field in _ORDER_LEVEL_FIELDS:
+        for field in _FORWARDED_FIELDS:
             if field in source:
-                payload[field] = source.get(field)
+                payload[field] = source[field]
     if actions:
         payload["action"] = actions[0]
     await handle_signal(payload)
     return {"status": "ok"}
+
+
+# Health probes are answered by the interceptor; the route above stays for
+# the OpenAPI schema and non-GET methods.
+app = HealthCheckInterceptor(api)